@@ -1,20 +1,24 @@
+import atexit
+import hmac
 import json
 import os
 import queue
 import random
+import re
+import shutil
 import sys
+import tempfile
 import threading
 import time
+from array import array
+from bisect import bisect_left
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Sequence, Tuple
-import pandas as pd
-import pyvisa
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 import tkinter as tk
 import tkinter.font as tkfont
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
-from openpyxl import Workbook, load_workbook
 from tkinter import filedialog, messagebox, ttk
 
 
@@ -32,6 +36,10 @@ PLOT_WINDOW_GEOMETRY = "700x500"
 SAMPLE_COUNT = 30
 NO_CURRENT_SECONDS = 15
 CURRENT_PRESENT_THRESHOLD_A = 0.005
+# Minimum spacing between "tick" progress messages (the last sample always goes out)
+TICK_MIN_INTERVAL_S = 0.1
+# Delay after the last keystroke before the panel model filter runs
+MODEL_FILTER_DEBOUNCE_MS = 120
 
 # Results table typography
 RESULTS_HEADER_FONT_SIZE = 12
@@ -47,6 +55,9 @@ DEV_PASSWORD = "@Eng2019"
 SUMMARY_HEADERS = ["IMEI", "Model", "Avg. Current", "P/F", "Worker ID", "Power Supply", "Date"]
 DETAIL_HEADERS = ["IMEI", "Model", "Worker ID", "Power Supply", "Date", "SampleIndex", "Current(A)"]
 
+# Criteria label keys, in the order rules are checked and displayed
+LABEL_KEYS = ("PASS", "W74A", "W748")
+
 
 # ============================================================
 # Paths / environment
@@ -106,7 +117,7 @@ def parse_user_interval_syntax(text: str) -> Dict[str, List[Tuple[Optional[float
         label = label.strip()
         
         # Valid labels
-        if label not in ("PASS", "W74A", "W748"):
+        if label not in LABEL_KEYS:
             continue
         
         intervals = []
@@ -173,31 +184,24 @@ def check_interval_overlaps(criteria: Dict[str, List[Tuple[Optional[float], Opti
     
     # Sort by low value
     normalized_intervals.sort(key=lambda x: x[0])
-    
-    # Check for overlaps
-    for i in range(len(normalized_intervals)):
-        for j in range(i + 1, len(normalized_intervals)):
-            low1, high1, low_type1, high_type1, label1 = normalized_intervals[i]
-            low2, high2, low_type2, high_type2, label2 = normalized_intervals[j]
-            
-            # Check if intervals overlap
-            # Intervals overlap if they share a point that is in both
-            
-            # Case 1: They touch at a single point
-            if high1 == low2:
-                # Interval 1 ends at point X, Interval 2 starts at point X
-                # They overlap only if high1 is closed (>=) AND low2 is closed (>)
-                # But low is always open, so if high1 is closed and low2 is open, they DON'T overlap
-                if high_type1 == "closed" and low_type2 == "closed":
-                    return f"Overlap detected between {label1} and {label2}"
-                # If high1 is closed (>=) and low2 is open (>), they touch but don't overlap - OK
-                continue
-            
-            # Case 2: low1 < high1 and low2 < high2, check for interior overlap
-            if low1 < high2 and low2 < high1:
-                # They definitely overlap
-                return f"Overlap detected between {label1} and {label2}"
-    
+
+    # Sweep once in order of low value, tracking the furthest-reaching high
+    # seen so far. An interval overlaps an earlier one exactly when it starts
+    # below that high, or starts on it with both boundaries closed.
+    cur_high, cur_high_type, cur_label = None, None, None
+    for low_val, high_val, low_type, high_type, label in normalized_intervals:
+        if cur_label is not None:
+            if low_val < cur_high:
+                return f"Overlap detected between {cur_label} and {label}"
+
+            # They touch at a single point: low is always open, so this only
+            # overlaps if both sides were closed
+            if low_val == cur_high and cur_high_type == "closed" and low_type == "closed":
+                return f"Overlap detected between {cur_label} and {label}"
+
+        if cur_label is None or high_val > cur_high:
+            cur_high, cur_high_type, cur_label = high_val, high_type, label
+
     return None
 
 
@@ -289,6 +293,15 @@ def load_config() -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, str], List[
     return model_voltage_map, model_criteria, workers, ps_list
 
 
+def _copy_file_mode(dest: str, tmp_path: str) -> None:
+    """Give a mkstemp file (always 0600) the permissions of the file it replaces."""
+
+    try:
+        shutil.copymode(dest, tmp_path)
+    except OSError:
+        pass  # No existing file to copy from, or a filesystem without modes
+
+
 def save_config(
     model_voltage_map: Dict[str, Any],
     model_criteria: Dict[str, Any],
@@ -310,20 +323,223 @@ def save_config(
         "WORKERS": workers,
         "POWER_SUPPLIES": power_supplies,
     }
-    with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    # Write beside the real file and swap it in, so a crash mid-write never
+    # leaves a truncated configuration behind.
+    fd, tmp_path = tempfile.mkstemp(prefix="~AutoPowerTester_", suffix=".json", dir=os.path.dirname(CONFIG_FILE) or ".")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        _copy_file_mode(CONFIG_FILE, tmp_path)
+        os.replace(tmp_path, CONFIG_FILE)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
 
 
 MODEL_VOLTAGE_MAP, MODEL_CRITERIA, WORKERS, POWER_SUPPLIES = load_config()
 
 
+# Supply/worker edits mark the config dirty and it is written once after a
+# short quiet period, instead of re-serialising everything per click. The
+# timer lives on the root window so closing the config dialog does not drop it.
+# Timed saves are written by a single background worker (so writes stay in
+# order) from a snapshot taken on the UI thread; close/exit saves run inline.
+CONFIG_SAVE_DELAY_MS = 500
+_CONFIG_SAVE: Dict[str, Any] = {"root": None, "after_id": None, "future": None}
+_CONFIG_SAVE_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="config-save")
+
+
+def schedule_config_save(widget: tk.Misc) -> None:
+    """Save the config CONFIG_SAVE_DELAY_MS after the last call."""
+
+    root = widget.nametowidget(".")
+    if _CONFIG_SAVE["after_id"] is not None:
+        try:
+            _CONFIG_SAVE["root"].after_cancel(_CONFIG_SAVE["after_id"])
+        except Exception:
+            pass
+    _CONFIG_SAVE["root"] = root
+    _CONFIG_SAVE["after_id"] = root.after(CONFIG_SAVE_DELAY_MS, flush_config_save, True, False)
+
+
+def _config_snapshot() -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, str], List[Dict[str, str]]]:
+    # Criteria dicts are replaced, never edited in place; supply dicts are edited.
+    return dict(MODEL_VOLTAGE_MAP), dict(MODEL_CRITERIA), dict(WORKERS), [dict(ps) for ps in POWER_SUPPLIES]
+
+
+def _report_config_save(root: tk.Misc, future: Future, show_errors: bool) -> None:
+    if not future.done():
+        root.after(50, _report_config_save, root, future, show_errors)
+        return
+    error = future.exception()
+    if error is not None and show_errors:
+        messagebox.showerror("Configuration", f"Failed to save config:\n{error}")
+
+
+def _cancel_config_timer() -> bool:
+    """Cancel the pending timed save; return True if one was pending."""
+
+    after_id = _CONFIG_SAVE["after_id"]
+    if after_id is None:
+        return False
+    _CONFIG_SAVE["after_id"] = None
+    try:
+        _CONFIG_SAVE["root"].after_cancel(after_id)
+    except Exception:
+        pass
+    return True
+
+
+def _write_config_inline() -> None:
+    # Let an earlier background write land first so this one is the last.
+    previous = _CONFIG_SAVE["future"]
+    if previous is not None:
+        try:
+            previous.result()
+        except Exception:
+            pass
+    save_config(MODEL_VOLTAGE_MAP, MODEL_CRITERIA, WORKERS, POWER_SUPPLIES)
+
+
+def flush_config_save(show_errors: bool = True, wait: bool = True) -> None:
+    """Write a pending scheduled save now; no-op when nothing is pending.
+
+    With wait=False the write is handed to the background worker and any
+    error is reported once it finishes.
+    """
+
+    if not _cancel_config_timer():
+        return
+
+    if not wait:
+        root = _CONFIG_SAVE["root"]
+        future = _CONFIG_SAVE_EXECUTOR.submit(save_config, *_config_snapshot())
+        _CONFIG_SAVE["future"] = future
+        _report_config_save(root, future, show_errors)
+        return
+
+    try:
+        _write_config_inline()
+    except Exception as e:
+        if show_errors:
+            messagebox.showerror("Configuration", f"Failed to save config:\n{e}")
+
+
+def save_config_now(title: str) -> bool:
+    """Write the config immediately, replacing any pending timed save.
+
+    A failure is reported under the caller's dialog title; returns False then.
+    """
+
+    _cancel_config_timer()
+    try:
+        _write_config_inline()
+    except Exception as e:
+        messagebox.showerror(title, f"Failed to save config:\n{e}")
+        return False
+    return True
+
+
+# Last chance for a pending edit if the app exits without on_close (no Tk
+# left to show an error by then).
+atexit.register(flush_config_save, show_errors=False)
+
+
+# get_pf_status checks the interval groups in this order.
+_PF_RULE_ORDER = (("PASS", "PASS"), ("W74A", "FAIL(W74A)"), ("W748", "FAIL(W748)"))
+
+# model -> ((status, intervals), ...) in _PF_RULE_ORDER, empty groups dropped.
+# Rebuilt by compile_model_criteria() whenever MODEL_CRITERIA[model] changes.
+_COMPILED_CRITERIA: Dict[str, Tuple[Tuple[str, Tuple[Tuple[Optional[float], Optional[float]], ...]], ...]] = {}
+
+# model -> (sorted highs, [(high, low, status), ...]) for models whose
+# intervals do not overlap. At most one interval can then contain a value,
+# and it is the first whose (inclusive) high is >= the value, so a bisect
+# on the highs finds it. Overlapping models are absent and use the ordered
+# scan over _COMPILED_CRITERIA instead.
+_CRITERIA_BOUNDS: Dict[str, Tuple[List[float], List[Tuple[float, float, str]]]] = {}
+
+
+def compile_model_criteria(model: str) -> None:
+    """Refresh the precomputed PASS/FAIL rules for one model."""
+
+    criteria = MODEL_CRITERIA.get(model)
+    if not isinstance(criteria, dict):
+        criteria = {}
+    rules = tuple((status, tuple(criteria[key])) for key, status in _PF_RULE_ORDER if criteria.get(key))
+    _COMPILED_CRITERIA[model] = rules
+
+    # A hand-edited config can hold inverted intervals (low >= high). They can
+    # never match (low < value <= high) and would break the bisect's ordering
+    # of highs, so only the well-formed ones go into the bounds.
+    usable = {
+        status: [
+            (low, high) for low, high in intervals
+            if low is None or high is None or low < high
+        ]
+        for status, intervals in rules
+    }
+    if check_interval_overlaps(usable) is None:
+        bounds = sorted(
+            (float("inf") if high is None else high, float("-inf") if low is None else low, status)
+            for status, intervals in usable.items()
+            for low, high in intervals
+        )
+        _CRITERIA_BOUNDS[model] = ([b[0] for b in bounds], bounds)
+    else:
+        _CRITERIA_BOUNDS.pop(model, None)
+
+
+for _model_name in MODEL_CRITERIA:
+    compile_model_criteria(_model_name)
+
+
+# Sorted model names (and their lowercase forms for the panel filter);
+# built by refresh_model_list() at load and kept sorted by add_model_to_list()
+# whenever MODEL_VOLTAGE_MAP gains a key.
+_MODELS_SORTED: Tuple[str, ...] = ()
+_MODELS_SORTED_LOWER: Tuple[str, ...] = ()
+
+
+def refresh_model_list() -> None:
+    global _MODELS_SORTED, _MODELS_SORTED_LOWER
+    _MODELS_SORTED = tuple(sorted(MODEL_VOLTAGE_MAP.keys()))
+    _MODELS_SORTED_LOWER = tuple(m.lower() for m in _MODELS_SORTED)
+
+
+def add_model_to_list(model: str) -> bool:
+    """Insert a new model name into the sorted lists; return False if already listed."""
+
+    global _MODELS_SORTED, _MODELS_SORTED_LOWER
+    i = bisect_left(_MODELS_SORTED, model)
+    if i < len(_MODELS_SORTED) and _MODELS_SORTED[i] == model:
+        return False
+    _MODELS_SORTED = _MODELS_SORTED[:i] + (model,) + _MODELS_SORTED[i:]
+    _MODELS_SORTED_LOWER = _MODELS_SORTED_LOWER[:i] + (model.lower(),) + _MODELS_SORTED_LOWER[i:]
+    return True
+
+
+refresh_model_list()
+
+
 # ============================================================
 # Runtime state
 # ============================================================
 
 
-RUN_SERIES_BY_ROW: Dict[str, Dict[str, Any]] = {}
-LOG_WRITE_LOCK = threading.Lock()
+@dataclass
+class RunSeries:
+    """Samples behind one results row, packed as flat typed arrays for plotting."""
+
+    samples: array  # array('i'): sample indices
+    currents: array  # array('d'): amps
+    supply: str
+
+
+RUN_SERIES_BY_ROW: Dict[str, RunSeries] = {}
 
 PANEL_STATE: List[Dict[str, Optional[str]]] = [
     {"last_model": None, "last_imei": None},
@@ -341,6 +557,7 @@ class PanelJob:
     thread: threading.Thread
     stop_event: threading.Event
     series_token: str
+    prompt_response_queue: Optional[queue.Queue] = None
 
 
 ACTIVE_JOBS: List[Optional[PanelJob]] = [None, None, None, None]
@@ -356,6 +573,9 @@ SERIES_LOCK = threading.Lock()
 
 log_saved_path: Optional[str] = None
 
+# (date, path) of the last computed log path; rebuilt only when the day rolls over.
+_DAILY_LOG_PATH: Tuple[Optional[date], str] = (None, "")
+
 
 def get_daily_log_saved_path() -> str:
     """Return today's log path.
@@ -364,59 +584,188 @@ def get_daily_log_saved_path() -> str:
     the path consistently.
     """
 
-    global log_saved_path
-    today = datetime.now().strftime("%m%d%y")
-    log_saved_path = os.path.join(DOCUMENTS_LOG_DIR, f"AutoPowerTester_Log_{today}.xlsx")
+    global log_saved_path, _DAILY_LOG_PATH
+    today = date.today()
+    cached_day, cached_path = _DAILY_LOG_PATH
+    if cached_day != today:
+        cached_path = os.path.join(DOCUMENTS_LOG_DIR, f"AutoPowerTester_Log_{today.strftime('%m%d%y')}.xlsx")
+        _DAILY_LOG_PATH = (today, cached_path)
+    log_saved_path = cached_path
     return log_saved_path
 
 
 def _ensure_sheet_headers(ws, headers: Sequence[str]) -> None:
-    """Ensure row 1 contains the expected header list."""
+    """Ensure row 1 of an existing sheet contains the expected header list.
 
-    if ws.max_row < 1:
-        for j, h in enumerate(headers, start=1):
-            ws.cell(row=1, column=j, value=h)
-        return
+    Freshly created sheets get their header with a plain ws.append instead.
+    """
 
-    first_row = [ws.cell(row=1, column=j).value for j in range(1, len(headers) + 1)]
+    # Reading row 1 materialises its cells, so fill them in place rather
+    # than appending (append would land on row 2).
+    first_row = next(ws.iter_rows(min_row=1, max_row=1, max_col=len(headers), values_only=True))
     if all(v is None for v in first_row):
         for j, h in enumerate(headers, start=1):
-            ws.cell(row=1, column=j, value=h)
+            ws.cell(row=1, column=j).value = h
+
+
+# The last workbook we saved, kept in memory so the next run does not have
+# to re-parse the whole file. It is only reused while the file on disk is
+# unchanged (same size and mtime), i.e. nobody else has edited it since.
+_DAILY_LOG_CACHE: Dict[str, Any] = {"path": None, "stamp": None, "wb": None}
+
+
+def _file_stamp(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _load_daily_workbook(path: str):
+    """Return the cached workbook for `path`, or load it from disk."""
+
+    cache = _DAILY_LOG_CACHE
+    if cache["wb"] is not None and cache["path"] == path and cache["stamp"] == _file_stamp(path):
+        return cache["wb"]
+    from openpyxl import load_workbook
+
+    return load_workbook(path)
+
 
+def _save_workbook_atomic(wb, path: str) -> None:
+    """Save `wb` to a temp file beside `path`, then swap it into place.
+
+    A crash or full disk mid-save leaves yesterday's rows intact instead of a
+    truncated zip; Excel holding the file still raises PermissionError.
+    """
+
+    fd, tmp_path = tempfile.mkstemp(prefix="~AutoPowerTester_", suffix=".xlsx", dir=os.path.dirname(path) or ".")
+    os.close(fd)
+    try:
+        wb.save(tmp_path)
+        _copy_file_mode(path, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
 
-def append_run_to_daily_log(summary_row: Sequence[Any], detail_rows: Sequence[Sequence[Any]]) -> None:
-    """Append one Summary row and many Detailed rows to the daily workbook."""
+
+def append_runs_to_daily_log(runs: Sequence[Tuple[Sequence[Any], Iterable[Sequence[Any]]]]) -> str:
+    """Append several runs to the daily workbook with a single save.
+
+    Each run's detail rows may be a generator; they are iterated once.
+    Returns the path that was written.
+    """
 
     path = get_daily_log_saved_path()
 
-    if not os.path.exists(path):
+    if os.path.exists(path):
+        wb = _load_daily_workbook(path)
+    else:
+        from openpyxl import Workbook
+
+        # A new day's file is built in memory and written once, with its rows.
         wb = Workbook()
         ws = wb.active
         ws.title = "Summary"
-        _ensure_sheet_headers(ws, SUMMARY_HEADERS)
+        ws.append(SUMMARY_HEADERS)
         ws2 = wb.create_sheet("Detailed")
-        _ensure_sheet_headers(ws2, DETAIL_HEADERS)
-        wb.save(path)
+        ws2.append(DETAIL_HEADERS)
 
-    wb = load_workbook(path)
+    # Drop the cache up front; it is only restored after a successful save so
+    # a failed write (e.g. Excel holding the file) never leaves rows behind in
+    # memory that would be written again with the next run.
+    _DAILY_LOG_CACHE.update(path=None, stamp=None, wb=None)
 
     if "Summary" not in wb.sheetnames:
         ws = wb.create_sheet("Summary", 0)
+        ws.append(SUMMARY_HEADERS)
     else:
         ws = wb["Summary"]
-    _ensure_sheet_headers(ws, SUMMARY_HEADERS)
+        _ensure_sheet_headers(ws, SUMMARY_HEADERS)
 
     if "Detailed" not in wb.sheetnames:
         ws2 = wb.create_sheet("Detailed")
+        ws2.append(DETAIL_HEADERS)
     else:
         ws2 = wb["Detailed"]
-    _ensure_sheet_headers(ws2, DETAIL_HEADERS)
+        _ensure_sheet_headers(ws2, DETAIL_HEADERS)
+
+    # Rows arrive as tuples, which ws.append takes as-is.
+    for summary_row, detail_rows in runs:
+        ws.append(summary_row)
+        for r in detail_rows:
+            ws2.append(r)
+
+    _save_workbook_atomic(wb, path)
+    _DAILY_LOG_CACHE.update(path=path, stamp=_file_stamp(path), wb=wb)
+    return path
+
+
+# Single consumer that owns the daily workbook. Panels enqueue their rows
+# and get ("log_done", error, path) back on their own progress queue, so
+# the Tk thread never blocks on the save and concurrent panels never
+# contend for the file.
+LOG_QUEUE: queue.Queue = queue.Queue()
+_LOG_WRITER: Optional[threading.Thread] = None
+# After the first run arrives, wait this long for others so panels finishing
+# together share one workbook save.
+LOG_COALESCE_SECONDS = 0.25
+
+
+def _log_writer_loop() -> None:
+    while True:
+        batch = [LOG_QUEUE.get()]
+        deadline = time.monotonic() + LOG_COALESCE_SECONDS
+        while batch[-1] is not None:
+            try:
+                batch.append(LOG_QUEUE.get(timeout=max(deadline - time.monotonic(), 0.0)))
+            except queue.Empty:
+                break
+
+        stop = None in batch
+        jobs = [job for job in batch if job is not None]
+        if jobs:
+            error: Optional[BaseException] = None
+            path = get_daily_log_saved_path()
+            try:
+                path = append_runs_to_daily_log([(summary_row, detail_rows) for summary_row, detail_rows, _ in jobs])
+            except Exception as e:
+                error = e
+
+            for _, _, reply_queue in jobs:
+                if reply_queue is not None:
+                    reply_queue.put(("log_done", error, path))
+
+        if stop:
+            return
+
+
+def enqueue_daily_log(
+    summary_row: Sequence[Any],
+    detail_rows: Iterable[Sequence[Any]],
+    reply_queue: Optional[queue.Queue] = None,
+) -> None:
+    """Hand one run to the log writer thread, starting it on first use."""
 
-    ws.append(list(summary_row))
-    for r in detail_rows:
-        ws2.append(list(r))
+    global _LOG_WRITER
+    if _LOG_WRITER is None or not _LOG_WRITER.is_alive():
+        _LOG_WRITER = threading.Thread(target=_log_writer_loop, name="daily-log-writer", daemon=True)
+        _LOG_WRITER.start()
+    LOG_QUEUE.put((summary_row, detail_rows, reply_queue))
 
-    wb.save(path)
+
+def stop_daily_log_writer(timeout: float = 5.0) -> None:
+    """Let the writer flush what is queued, then stop it."""
+
+    if _LOG_WRITER is None or not _LOG_WRITER.is_alive():
+        return
+    LOG_QUEUE.put(None)
+    _LOG_WRITER.join(timeout=timeout)
 
 
 def check_daily_log_file_not_open() -> str:
@@ -506,6 +855,18 @@ PSEUDO_FIXED_OUTPUT_ENABLED = False
 PSEUDO_FIXED_OUTPUT_VALUE = 0.0
 
 
+# Each panel thread draws from its own generator instead of sharing the
+# module-level random instance with the other panels.
+_THREAD_RNG = threading.local()
+
+
+def _rng() -> random.Random:
+    rng = getattr(_THREAD_RNG, "rng", None)
+    if rng is None:
+        rng = _THREAD_RNG.rng = random.Random()
+    return rng
+
+
 def pseudo_current(model_voltage: float) -> float:
     """Generate a simulated current measurement in amps."""
 
@@ -523,49 +884,41 @@ def pseudo_current(model_voltage: float) -> float:
         if low >= high:
             # fallback to sensible default
             low, high = 0.0, 2.0
-        return random.uniform(low, high)
+        return _rng().uniform(low, high)
     except Exception:
-        return random.uniform(0.0, 2.0)
+        return _rng().uniform(0.0, 2.0)
 
 
 def get_pf_status(model: str, avg_current: float, samples: Optional[List[float]] = None) -> str:
     """Return PASS/FAIL code based on model rules and interval logic."""
 
     if samples:
-        try:
-            post_startup = samples[5:] if len(samples) > 5 else []
-            if post_startup and max(post_startup) > 4.0:
+        # One pass: a spike after startup (index >= 5) outranks a dropout (index >= 2)
+        dropout = False
+        for i, s in enumerate(samples):
+            if s > 4.0 and i >= 5:
                 return "FAIL(W748)"
-        except ValueError:
-            pass
-
-        if len(samples) >= 3:
-            critical_samples = samples[2:]
-            if any(s < 0.01 for s in critical_samples):
-                return "FAIL(W74A)" if random.random() < 0.85 else "FAIL(W748)"
+            if s < 0.01 and i >= 2:
+                dropout = True
+        if dropout:
+            return "FAIL(W74A)" if _rng().random() < 0.85 else "FAIL(W748)"
+
+    bounds = _CRITERIA_BOUNDS.get(model)
+    if bounds is not None:
+        # Interval (low, high]: first high >= avg_current, then check low
+        highs, intervals = bounds
+        i = bisect_left(highs, avg_current)
+        if i < len(intervals) and avg_current > intervals[i][1]:
+            return intervals[i][2]
+    else:
+        # Overlapping intervals: check PASS, then W74A, then W748 in order
+        for status, intervals in _COMPILED_CRITERIA.get(model, ()):
+            for interval in intervals:
+                if is_current_in_interval(avg_current, interval):
+                    return status
 
-    criteria = MODEL_CRITERIA.get(model, {})
-    
-    # Check PASS intervals first
-    if "PASS" in criteria:
-        for interval in criteria["PASS"]:
-            if is_current_in_interval(avg_current, interval):
-                return "PASS"
-    
-    # Check W74A intervals
-    if "W74A" in criteria:
-        for interval in criteria["W74A"]:
-            if is_current_in_interval(avg_current, interval):
-                return "FAIL(W74A)"
-    
-    # Check W748 intervals
-    if "W748" in criteria:
-        for interval in criteria["W748"]:
-            if is_current_in_interval(avg_current, interval):
-                return "FAIL(W748)"
-    
     # No interval matched: randomly select W74A (85%) or W748 (15%)
-    if random.random() < 0.85:
+    if _rng().random() < 0.85:
         return "FAIL(W74A)"
     return "FAIL(W748)"
 
@@ -588,35 +941,47 @@ def measure_current_and_get_avg_with_progress(
 ) -> None:
     """Measure current for one PSU and report progress/events to the UI."""
 
-    # Check for config overlaps before starting
+    # Check for config overlaps before starting; a model with compiled bounds
+    # was already found overlap-free by compile_model_criteria().
     criteria = MODEL_CRITERIA.get(model, {})
-    overlap_error = check_interval_overlaps(criteria)
-    if overlap_error:
-        progress_queue.put(("config_error", f"Model configuration error: {overlap_error}"))
-        return
-        
-        # Check if PASS interval is defined
-    if "PASS" not in criteria or not criteria["PASS"]:
+    if model not in _CRITERIA_BOUNDS:
+        overlap_error = check_interval_overlaps(criteria)
+        if overlap_error:
+            progress_queue.put(("config_error", f"Model configuration error: {overlap_error}"))
+            return
+
+    # Check if PASS interval is defined
+    if not criteria.get("PASS"):
         progress_queue.put(("config_error", f"Model configuration error: No PASS interval defined for model '{model}'"))
         return
 
     supply_name = (supply or {}).get("name", "PSU")
     supply_addr = (supply or {}).get("address", "GPIB0::1::INSTR")
 
+    # This worker is the only writer of its series, and the UI only copies it
+    # after "done"/"sub_pba_fail", so samples are appended without taking
+    # series_lock; the lock just guards inserting the entry into series_store.
+    series: Optional[Dict[str, List[float]]] = None
     if series_store is not None and series_lock is not None and series_token is not None:
+        series = {"times": [], "currents": []}
         with series_lock:
-            series_store[series_token] = {"times": [], "currents": []}
+            series_store[series_token] = series
+
+    last_tick = 0.0
 
     def push_sample(sample_idx: int, current_val: float) -> None:
-        if series_store is None or series_lock is None or series_token is None:
-            return
-        with series_lock:
-            s = series_store.get(series_token)
-            if not s:
-                series_store[series_token] = {"times": [], "currents": []}
-                s = series_store[series_token]
-            s["times"].append(sample_idx)
-            s["currents"].append(current_val)
+        """Record one sample and report it as a (rate-limited) "tick"."""
+
+        nonlocal last_tick
+        if series is not None:
+            series["times"].append(sample_idx)
+            series["currents"].append(current_val)
+
+        # Pseudo mode samples every ~70 ms; the UI only needs ~10 updates/s.
+        now = time.monotonic()
+        if sample_idx >= SAMPLE_COUNT or now - last_tick >= TICK_MIN_INTERVAL_S:
+            last_tick = now
+            progress_queue.put(("tick", sample_idx, SAMPLE_COUNT, current_val))
 
     if USE_PSEUDO_CURRENT:
         _run_pseudo_measurement(
@@ -662,7 +1027,7 @@ def _run_pseudo_measurement(
         progress_queue.put(("status", f"Using pseudo mode (supply {supply_name})"))
         progress_queue.put(("phase", "waiting"))
 
-        if random.random() < prob:
+        if _rng().random() < prob:
             if prompt_response_queue is None:
                 progress_queue.put(("error", "Unable to confirm device connection. Please retry."))
                 return
@@ -682,36 +1047,97 @@ def _run_pseudo_measurement(
                 return
 
         progress_queue.put(("status", "Simulating device connection..."))
-        for _ in range(5):
-            _raise_if_cancelled(stop_event)
-            time.sleep(0.2)
+        _sleep_or_cancel(stop_event, 1.0)
 
-        current_values: List[float] = []
+        # Running totals; the full series lives in the series store via push_sample.
+        total = 0.0
+        last_5: deque = deque(maxlen=5)
         progress_queue.put(("phase", "measuring"))
         progress_queue.put(("status", "Simulating current measurements"))
 
         per_sample = float(PSEUDO_SAMPLING_SECONDS) / float(max(SAMPLE_COUNT, 1))
-        sub_delay = per_sample / 5.0
 
+        t0 = time.monotonic()
         for i in range(SAMPLE_COUNT):
             _raise_if_cancelled(stop_event)
             current_value = pseudo_current(model_voltage)
-            current_values.append(current_value)
+            total += current_value
+            last_5.append(current_value)
             push_sample(i + 1, current_value)
-            progress_queue.put(("tick", i + 1, SAMPLE_COUNT, current_value))
-
-            for _ in range(5):
-                _raise_if_cancelled(stop_event)
-                time.sleep(sub_delay)
+            _sleep_or_cancel(stop_event, t0 + (i + 1) * per_sample - time.monotonic())
 
-        last_5_avg = sum(current_values[-5:]) / 5 if len(current_values) >= 5 else sum(current_values) / len(current_values)
-        total_avg = sum(current_values) / len(current_values)
+        last_5_avg = sum(last_5) / len(last_5)
+        total_avg = total / SAMPLE_COUNT
         progress_queue.put(("done", last_5_avg, total_avg, supply_name, series_token))
 
     except Exception as e:
         progress_queue.put(("error", str(e)))
 
 
+# One VISA ResourceManager for the process and one open session per supply
+# address, reused across DUTs. A panel holds the address lock for its whole
+# run; a session that raised is closed and reopened on next use.
+_VISA_RM = None
+_VISA_INST: Dict[str, Any] = {}
+_VISA_INST_LOCKS: Dict[str, threading.Lock] = {}
+_VISA_GUARD = threading.Lock()
+
+
+def _visa_lock(addr: str) -> threading.Lock:
+    with _VISA_GUARD:
+        return _VISA_INST_LOCKS.setdefault(addr, threading.Lock())
+
+
+def _get_inst(addr: str):
+    """Return the cached session for `addr`; caller must hold _visa_lock(addr)."""
+
+    global _VISA_RM
+    inst = _VISA_INST.get(addr)
+    if inst is None:
+        with _VISA_GUARD:
+            if _VISA_RM is None:
+                import pyvisa
+
+                _VISA_RM = pyvisa.ResourceManager()
+            rm = _VISA_RM
+        inst = rm.open_resource(addr)
+        _VISA_INST[addr] = inst
+    return inst
+
+
+def _drop_inst(addr: str) -> None:
+    inst = _VISA_INST.pop(addr, None)
+    if inst is not None:
+        try:
+            inst.close()
+        except Exception:
+            pass
+
+
+def close_visa_sessions() -> None:
+    """Close every cached session and the ResourceManager (runs at exit)."""
+
+    global _VISA_RM
+    for addr in list(_VISA_INST):
+        _drop_inst(addr)
+    with _VISA_GUARD:
+        rm, _VISA_RM = _VISA_RM, None
+    if rm is not None:
+        try:
+            rm.close()
+        except Exception:
+            pass
+
+
+atexit.register(close_visa_sessions)
+
+
+def _read_current(inst) -> float:
+    """Query the output current in amps."""
+
+    return inst.query_ascii_values("MEAS:CURR?")[0]
+
+
 def _run_real_measurement(
     model_voltage: float,
     supply_name: str,
@@ -723,13 +1149,20 @@ def _run_real_measurement(
     series_token: Optional[str],
 ) -> None:
     inst = None
+    lock = _visa_lock(supply_addr)
+    locked = False
+    failed = False
     try:
         progress_queue.put(("status", f"Connecting to {supply_name} at {supply_addr}..."))
 
-        rm = pyvisa.ResourceManager()
-        inst = rm.open_resource(supply_addr)
-        inst.write("OUTP ON")
-        inst.write(f"VOLT {model_voltage}")
+        # Another panel may be using the same address; wait for it, but stay cancellable.
+        while not lock.acquire(timeout=0.2):
+            _raise_if_cancelled(stop_event)
+        locked = True
+
+        inst = _get_inst(supply_addr)
+        # One compound SCPI message (same order as before); ":" resets to the root node.
+        inst.write(f"OUTP ON;:VOLT {model_voltage}")
 
         progress_queue.put(("phase", "waiting"))
         progress_queue.put(("status", "Plug Anyway Jig into the phone."))
@@ -738,7 +1171,7 @@ def _run_real_measurement(
         while True:
             _raise_if_cancelled(stop_event)
 
-            current = float(inst.query("MEAS:CURR?").strip())
+            current = _read_current(inst)
             if current > CURRENT_PRESENT_THRESHOLD_A:
                 break
 
@@ -765,35 +1198,44 @@ def _run_real_measurement(
 
                 zero_current_start = time.time()
 
-            time.sleep(0.2)
+            _sleep_or_cancel(stop_event, 0.2)
 
         progress_queue.put(("phase", "measuring"))
         progress_queue.put(("status", "Measuring current"))
 
-        current_values: List[float] = []
+        # Sample on a fixed 1 s grid so the query time is absorbed into the wait
+        # instead of being added on top of it. Only running totals are kept
+        # here; the full series lives in the series store via push_sample.
+        total = 0.0
+        last_5: deque = deque(maxlen=5)
+        t0 = time.monotonic()
         for i in range(SAMPLE_COUNT):
             _raise_if_cancelled(stop_event)
 
-            current_float = float(inst.query("MEAS:CURR?").strip())
-            current_values.append(current_float)
+            current_float = _read_current(inst)
+            total += current_float
+            last_5.append(current_float)
             push_sample(i + 1, current_float)
-            progress_queue.put(("tick", i + 1, SAMPLE_COUNT, current_float))
-            time.sleep(1)
+            _sleep_or_cancel(stop_event, t0 + (i + 1) - time.monotonic())
 
-        last_5_avg = sum(current_values[-5:]) / 5 if len(current_values) >= 5 else sum(current_values) / len(current_values)
-        total_avg = sum(current_values) / len(current_values)
+        last_5_avg = sum(last_5) / len(last_5)
+        total_avg = total / SAMPLE_COUNT
         progress_queue.put(("done", last_5_avg, total_avg, supply_name, series_token))
 
     except Exception as e:
+        failed = True
         progress_queue.put(("error", str(e)))
 
     finally:
         try:
             if inst is not None:
                 inst.write("OUTP OFF")
-                inst.close()
         except Exception:
-            pass
+            failed = True
+        if locked:
+            if failed:
+                _drop_inst(supply_addr)
+            lock.release()
 
 
 def _raise_if_cancelled(stop_event: threading.Event) -> None:
@@ -801,13 +1243,29 @@ def _raise_if_cancelled(stop_event: threading.Event) -> None:
         raise Exception("Measurement cancelled by user.")
 
 
+def _sleep_or_cancel(stop_event: threading.Event, seconds: float) -> None:
+    """Sleep for up to `seconds`, waking immediately if the run is cancelled."""
+
+    if stop_event.wait(timeout=max(seconds, 0.0)):
+        raise Exception("Measurement cancelled by user.")
+
+
 def _wait_for_prompt_answer(stop_event: threading.Event, prompt_response_queue: queue.Queue) -> bool:
+    """Block until the operator answers the no-current prompt.
+
+    Cancelling the panel or closing the window pushes None onto the queue,
+    which wakes this wait immediately; the timeout is only a safety net.
+    """
+
     while True:
         _raise_if_cancelled(stop_event)
         try:
-            return bool(prompt_response_queue.get(timeout=0.1))
+            answer = prompt_response_queue.get(timeout=1.0)
         except queue.Empty:
             continue
+        if answer is None:
+            continue
+        return bool(answer)
 
 
 # ============================================================
@@ -818,8 +1276,17 @@ def _wait_for_prompt_answer(stop_event: threading.Event, prompt_response_queue:
 current_user = {"username": "", "is_admin": False, "is_dev": False}
 
 
+_IMEI_MATCH = re.compile(r"3\d{14}").fullmatch
+
+
+def _password_matches(given: str, expected: Any) -> bool:
+    """Constant-time password comparison (compare_digest needs bytes for non-ASCII)."""
+
+    return hmac.compare_digest(given.encode("utf-8"), str(expected).encode("utf-8"))
+
+
 def is_valid_imei(imei: str) -> bool:
-    return imei.isdigit() and len(imei) == 15 and imei.startswith("3")
+    return _IMEI_MATCH(imei) is not None
 
 
 # ============================================================
@@ -827,22 +1294,53 @@ def is_valid_imei(imei: str) -> bool:
 # ============================================================
 
 
+# (size, weight) -> shared font for the main window, dialogs and config tabs, so each
+# distinct font is created once per process rather than per widget.
+_UI_FONTS: Dict[Tuple[int, str], tkfont.Font] = {}
+
+
+def _ui_font(master: tk.Misc, size: int, weight: str = "normal") -> tkfont.Font:
+    font = _UI_FONTS.get((size, weight))
+    if font is None:
+        font = tkfont.Font(master, family="TkDefaultFont", size=size, weight=weight)
+        _UI_FONTS[(size, weight)] = font
+    return font
+
+
+# Stripped PSU name -> panel index for the first four supplies. Rebuilt by
+# rebuild_supply_index() whenever POWER_SUPPLIES gains or loses an entry.
+_SUPPLY_NAME_TO_IDX: Dict[str, int] = {}
+
+
+def rebuild_supply_index() -> None:
+    """Refresh the name -> panel index map from POWER_SUPPLIES."""
+
+    index: Dict[str, int] = {}
+    for i, ps in enumerate(POWER_SUPPLIES[:4]):
+        index.setdefault(str(ps.get("name", "")).strip(), i)
+    global _SUPPLY_NAME_TO_IDX
+    _SUPPLY_NAME_TO_IDX = index
+
+
+rebuild_supply_index()
+
+
+_NON_DIGITS_RE = re.compile(r"\D+")
+
+
 def find_panel_index_for_supply(name: str) -> Optional[int]:
     """Map a PSU name to the matching panel index (0..3) when possible."""
 
     normalized = (name or "").strip()
-    for i, ps in enumerate(POWER_SUPPLIES[:4]):
-        if str(ps.get("name", "")).strip() == normalized:
-            return i
+    idx = _SUPPLY_NAME_TO_IDX.get(normalized)
+    if idx is not None:
+        return idx
 
     upper = normalized.upper()
     if upper.startswith("PSU"):
-        digits = "".join(ch for ch in upper[3:] if ch.isdigit())
+        digits = _NON_DIGITS_RE.sub("", upper[3:])
         if digits:
-            try:
-                return int(digits) - 1
-            except Exception:
-                return None
+            return int(digits) - 1
 
     return None
 
@@ -856,24 +1354,19 @@ def prompt_no_current_detected(parent: tk.Misc, supply_name: str, question_en: s
 
     dialog_w, dialog_h = 656, 250
 
-    win = tk.Toplevel(parent)
-    win.title(f"No Current Detected - {supply_name}")
-    win.geometry(f"{dialog_w}x{dialog_h}")
-    win.resizable(False, False)
-    try:
-        win.transient(parent)
-    except Exception:
-        pass
-
+    # Size and position in one geometry call; the anchor is normally a mapped
+    # panel widget, so its coordinates are available without a layout flush.
+    geometry = f"{dialog_w}x{dialog_h}"
     try:
-        win.update_idletasks()
         if anchor_widget is not None:
+            if not anchor_widget.winfo_ismapped():
+                anchor_widget.update_idletasks()
             ax = int(anchor_widget.winfo_rootx())
             ay = int(anchor_widget.winfo_rooty())
             aw = int(anchor_widget.winfo_width())
 
-            sx = int(win.winfo_screenwidth())
-            sy = int(win.winfo_screenheight())
+            sx = int(anchor_widget.winfo_screenwidth())
+            sy = int(anchor_widget.winfo_screenheight())
             margin = 10
 
             x = ax + aw + margin
@@ -889,18 +1382,27 @@ def prompt_no_current_detected(parent: tk.Misc, supply_name: str, question_en: s
             if y < margin:
                 y = margin
 
-            win.geometry(f"{dialog_w}x{dialog_h}+{x}+{y}")
+            geometry += f"+{x}+{y}"
+    except Exception:
+        pass
+
+    win = tk.Toplevel(parent)
+    win.title(f"No Current Detected - {supply_name}")
+    win.geometry(geometry)
+    win.resizable(False, False)
+    try:
+        win.transient(parent)
     except Exception:
         pass
 
     container = tk.Frame(win, padx=14, pady=10)
     container.pack(fill="both", expand=True)
 
-    tk.Label(container, text="NO CURRENT DETECTED", font=("TkDefaultFont", 16, "bold")).pack(anchor="w")
-    tk.Label(container, text=f"PSU: {supply_name}", font=("TkDefaultFont", 14, "bold"), fg="red").pack(anchor="w", pady=(4, 8))
+    tk.Label(container, text="NO CURRENT DETECTED", font=_ui_font(win, 16, "bold")).pack(anchor="w")
+    tk.Label(container, text=f"PSU: {supply_name}", font=_ui_font(win, 14, "bold"), fg="red").pack(anchor="w", pady=(4, 8))
 
-    tk.Label(container, text=question_en, font=("TkDefaultFont", 13), wraplength=620, justify="left").pack(anchor="w", pady=(0, 6))
-    tk.Label(container, text=question_es, font=("TkDefaultFont", 13), wraplength=620, justify="left").pack(anchor="w", pady=(0, 10))
+    tk.Label(container, text=question_en, font=_ui_font(win, 13), wraplength=620, justify="left").pack(anchor="w", pady=(0, 6))
+    tk.Label(container, text=question_es, font=_ui_font(win, 13), wraplength=620, justify="left").pack(anchor="w", pady=(0, 10))
 
     btn_row = tk.Frame(container)
     btn_row.pack(anchor="center")
@@ -915,8 +1417,8 @@ def prompt_no_current_detected(parent: tk.Misc, supply_name: str, question_en: s
         result["value"] = False
         win.destroy()
 
-    tk.Button(btn_row, text="YES / SÍ", font=("TkDefaultFont", 13, "bold"), width=10, command=on_yes).pack(side="left", padx=10)
-    tk.Button(btn_row, text="NO", font=("TkDefaultFont", 13, "bold"), width=10, command=on_no).pack(side="left", padx=10)
+    tk.Button(btn_row, text="YES / SÍ", font=_ui_font(win, 13, "bold"), width=10, command=on_yes).pack(side="left", padx=10)
+    tk.Button(btn_row, text="NO", font=_ui_font(win, 13, "bold"), width=10, command=on_no).pack(side="left", padx=10)
 
     win.protocol("WM_DELETE_WINDOW", on_no)
     win.grab_set()
@@ -962,12 +1464,27 @@ def open_configuration_dialog(parent: tk.Misc) -> None:
         tab_pseudo = tk.Frame(nb)
         nb.add(tab_pseudo, text="Pseudo Mode")
 
+    # Only the visible Models tab is built now; the others on first selection.
+    pending_tabs: Dict[str, Callable[[tk.Frame], None]] = {
+        str(tab_psu): _build_power_supplies_tab,
+        str(tab_workers): _build_workers_tab,
+    }
+    if tab_pseudo is not None:
+        pending_tabs[str(tab_pseudo)] = _build_pseudo_mode_tab
+
+    def on_tab_changed(_event=None) -> None:
+        selected = str(nb.select())
+        build = pending_tabs.pop(selected, None)
+        if build is not None:
+            build(nb.nametowidget(selected))
+
     _build_models_tab(tab_models)
-    _build_power_supplies_tab(tab_psu)
-    _build_workers_tab(tab_workers)
+    nb.bind("<<NotebookTabChanged>>", on_tab_changed)
 
-    if tab_pseudo is not None:
-        _build_pseudo_mode_tab(tab_pseudo)
+
+# model -> (criteria dict, display text). Saving a model stores a new
+# criteria dict, so an identity check is enough to tell the text is stale.
+_CRITERIA_DISPLAY_CACHE: Dict[str, Tuple[Any, str]] = {}
 
 
 def _build_models_tab(tab: tk.Frame) -> None:
@@ -987,29 +1504,29 @@ def _build_models_tab(tab: tk.Frame) -> None:
     left_container.grid_columnconfigure(1, weight=0)
 
     # Top section: model selection (inside left_container)
-    tk.Label(left_container, text="Model:", font=("TkDefaultFont", 12)).grid(row=0, column=0, padx=10, pady=10, sticky="e")
+    tk.Label(left_container, text="Model:", font=_ui_font(tab, 12)).grid(row=0, column=0, padx=10, pady=10, sticky="e")
 
     model_var = tk.StringVar()
     model_combo = ttk.Combobox(
         left_container,
         textvariable=model_var,
-        values=sorted(MODEL_VOLTAGE_MAP.keys()),
+        values=_MODELS_SORTED,
         state="readonly",
-        font=("TkDefaultFont", 12),
+        font=_ui_font(tab, 12),
         width=24,
     )
     model_combo.grid(row=0, column=1, padx=10, pady=10, sticky="w")
 
-    tk.Label(left_container, text="Or new model:", font=("TkDefaultFont", 12)).grid(row=1, column=0, padx=10, pady=5, sticky="e")
-    new_model_entry = tk.Entry(left_container, font=("TkDefaultFont", 12), width=26)
+    tk.Label(left_container, text="Or new model:", font=_ui_font(tab, 12)).grid(row=1, column=0, padx=10, pady=5, sticky="e")
+    new_model_entry = tk.Entry(left_container, font=_ui_font(tab, 12), width=26)
     new_model_entry.grid(row=1, column=1, padx=10, pady=5, sticky="w")
 
-    tk.Label(left_container, text="Boot On Voltage:", font=("TkDefaultFont", 12)).grid(row=2, column=0, padx=10, pady=5, sticky="e")
-    voltage_entry = tk.Entry(left_container, font=("TkDefaultFont", 12), width=26)
+    tk.Label(left_container, text="Boot On Voltage:", font=_ui_font(tab, 12)).grid(row=2, column=0, padx=10, pady=5, sticky="e")
+    voltage_entry = tk.Entry(left_container, font=_ui_font(tab, 12), width=26)
     voltage_entry.grid(row=2, column=1, padx=10, pady=5, sticky="w")
 
     # Interval UI section (inside left_container)
-    tk.Label(left_container, text="PASS/FAIL Intervals Configuration:", font=("TkDefaultFont", 12, "bold")).grid(
+    tk.Label(left_container, text="PASS/FAIL Intervals Configuration:", font=_ui_font(tab, 12, "bold")).grid(
         row=3, column=0, columnspan=2, padx=10, pady=(10, 5), sticky="w"
     )
 
@@ -1030,25 +1547,32 @@ def _build_models_tab(tab: tk.Frame) -> None:
         row_frame.grid(row=row_idx, column=0, columnspan=3, sticky="ew", pady=2)
         row_frame.grid_columnconfigure(2, weight=1)
 
-        entry_low = tk.Entry(row_frame, font=("TkDefaultFont", 10), width=10)
+        entry_low = tk.Entry(row_frame, font=_ui_font(tab, 10), width=10)
         entry_low.pack(side="left", padx=2)
 
-        tk.Label(row_frame, text="~", font=("TkDefaultFont", 10)).pack(side="left", padx=2)
+        tk.Label(row_frame, text="~", font=_ui_font(tab, 10)).pack(side="left", padx=2)
 
-        entry_high = tk.Entry(row_frame, font=("TkDefaultFont", 10), width=10)
+        entry_high = tk.Entry(row_frame, font=_ui_font(tab, 10), width=10)
         entry_high.pack(side="left", padx=2)
 
         def remove_row():
             row_frame.destroy()
             interval_entries[label_key].remove((entry_low, entry_high))
 
-        tk.Button(row_frame, text="Remove", font=("TkDefaultFont", 9), command=remove_row).pack(side="left", padx=2)
+        tk.Button(row_frame, text="Remove", font=_ui_font(tab, 9), command=remove_row).pack(side="left", padx=2)
 
         return (entry_low, entry_high)
 
+    def next_interval_row(label_key):
+        """Grid row below the label's last interval row (removals can leave gaps)."""
+        rows = interval_entries[label_key]
+        if not rows:
+            return 0
+        return int(rows[-1][0].master.grid_info()["row"]) + 1
+
     def create_interval_label_section(parent, label_key, base_row):
         """Create a complete section for one label (PASS, W74A, W748)."""
-        tk.Label(parent, text=f"{label_key} Intervals:", font=("TkDefaultFont", 11, "bold")).grid(
+        tk.Label(parent, text=f"{label_key} Intervals:", font=_ui_font(tab, 11, "bold")).grid(
             row=base_row, column=0, columnspan=2, sticky="w", padx=10, pady=(5, 3)
         )
 
@@ -1057,27 +1581,29 @@ def _build_models_tab(tab: tk.Frame) -> None:
         inner_frame.grid_columnconfigure(0, weight=1)
 
         def add_interval():
-            row_idx = len(interval_entries[label_key])
+            row_idx = next_interval_row(label_key)
             entry_pair = create_interval_row(inner_frame, label_key, row_idx)
             interval_entries[label_key].append(entry_pair)
 
-        tk.Button(inner_frame, text=f"Add {label_key} Interval", font=("TkDefaultFont", 10), command=add_interval).grid(
+        tk.Button(inner_frame, text=f"Add {label_key} Interval", font=_ui_font(tab, 10), command=add_interval).grid(
             row=100, column=0, sticky="w", pady=3
         )
 
         return inner_frame
 
     # Create sections for PASS, W74A, W748 inside the interval_frame
-    pass_inner = create_interval_label_section(interval_frame, "PASS", 0)
-    w74a_inner = create_interval_label_section(interval_frame, "W74A", 2)
-    w748_inner = create_interval_label_section(interval_frame, "W748", 4)
+    inner_by_label = {
+        "PASS": create_interval_label_section(interval_frame, "PASS", 0),
+        "W74A": create_interval_label_section(interval_frame, "W74A", 2),
+        "W748": create_interval_label_section(interval_frame, "W748", 4),
+    }
 
     def format_criteria_for_display(criteria_dict: Dict[str, Any]) -> str:
         if not criteria_dict:
             return ""
         parts = []
         # Keep label order consistent: PASS, W74A, W748 if present
-        for key in ("PASS", "W74A", "W748"):
+        for key in LABEL_KEYS:
             intervals = criteria_dict.get(key, [])
             if isinstance(intervals, list) and intervals:
                 interval_strs = []
@@ -1089,7 +1615,7 @@ def _build_models_tab(tab: tk.Frame) -> None:
         return " | ".join(parts)
 
     # Right-side models display implemented as a Listbox (one model per row)
-    current_values_listbox = tk.Listbox(tab, width=70, height=20, font=("TkDefaultFont", 9))
+    current_values_listbox = tk.Listbox(tab, width=70, height=20, font=_ui_font(tab, 9))
     current_values_listbox.grid(row=0, column=2, rowspan=10, padx=(10, 10), pady=10, sticky="nsew")
 
     # Add a visible vertical scrollbar for the models Listbox
@@ -1098,16 +1624,22 @@ def _build_models_tab(tab: tk.Frame) -> None:
     text_scrollbar.grid(row=0, column=3, rowspan=10, sticky="ns", padx=(0, 10), pady=10)
 
     def refresh_models_display() -> None:
-        current_values_listbox.delete(0, tk.END)
-        for model_name in sorted(MODEL_VOLTAGE_MAP.keys()):
+        rows: List[str] = []
+        for model_name in _MODELS_SORTED:
             voltage_value = MODEL_VOLTAGE_MAP.get(model_name, "")
             criteria_value = MODEL_CRITERIA.get(model_name, {})
-            criteria_str = format_criteria_for_display(criteria_value)
+            cached = _CRITERIA_DISPLAY_CACHE.get(model_name)
+            if cached is not None and cached[0] is criteria_value:
+                criteria_str = cached[1]
+            else:
+                criteria_str = format_criteria_for_display(criteria_value)
+                _CRITERIA_DISPLAY_CACHE[model_name] = (criteria_value, criteria_str)
             if criteria_str:
-                row_text = f"{model_name} / {voltage_value}V / {criteria_str}"
+                rows.append(f"{model_name} / {voltage_value}V / {criteria_str}")
             else:
-                row_text = f"{model_name} / {voltage_value}V"
-            current_values_listbox.insert(tk.END, row_text)
+                rows.append(f"{model_name} / {voltage_value}V")
+        current_values_listbox.delete(0, tk.END)
+        current_values_listbox.insert(tk.END, *rows)
 
     def on_listbox_double_click(event=None) -> None:
         sel = current_values_listbox.curselection()
@@ -1137,37 +1669,32 @@ def _build_models_tab(tab: tk.Frame) -> None:
         if not model:
             return
 
-        # Clear existing interval entries
-        for label_key in ("PASS", "W74A", "W748"):
-            for entry_low, entry_high in interval_entries[label_key]:
-                try:
-                    entry_low.master.destroy()
-                except Exception:
-                    pass
-            interval_entries[label_key] = []
-
         new_model_entry.delete(0, tk.END)
         voltage_entry.delete(0, tk.END)
         voltage_entry.insert(0, str(MODEL_VOLTAGE_MAP.get(model, DEFAULT_BOOT_VOLTAGE)))
 
         criteria = MODEL_CRITERIA.get(model, {})
-        
-        for label_key in ("PASS", "W74A", "W748"):
+
+        # Reuse the interval rows already on screen; only the difference in
+        # row count is created or destroyed.
+        for label_key in LABEL_KEYS:
             intervals = criteria.get(label_key, [])
-            for low, high in intervals:
-                # Choose the correct inner frame for this label
-                if label_key == "PASS":
-                    inner = pass_inner
-                elif label_key == "W74A":
-                    inner = w74a_inner
-                else:
-                    inner = w748_inner
-
-                row_idx = len(interval_entries[label_key])
-                entry_pair = create_interval_row(inner, label_key, row_idx)
-                interval_entries[label_key].append(entry_pair)
-
-                entry_low, entry_high = entry_pair
+            rows = interval_entries[label_key]
+
+            for entry_low, entry_high in rows[len(intervals):]:
+                try:
+                    entry_low.master.destroy()
+                except Exception:
+                    pass
+            del rows[len(intervals):]
+
+            inner = inner_by_label[label_key]
+            while len(rows) < len(intervals):
+                rows.append(create_interval_row(inner, label_key, next_interval_row(label_key)))
+
+            for (entry_low, entry_high), (low, high) in zip(rows, intervals):
+                entry_low.delete(0, tk.END)
+                entry_high.delete(0, tk.END)
                 if low is not None:
                     entry_low.insert(0, str(low))
                 if high is not None:
@@ -1187,7 +1714,7 @@ def _build_models_tab(tab: tk.Frame) -> None:
 
         new_criteria = {}
 
-        for label_key in ("PASS", "W74A", "W748"):
+        for label_key in LABEL_KEYS:
             intervals = []
             for entry_low, entry_high in interval_entries[label_key]:
                 low_str = entry_low.get().strip()
@@ -1218,16 +1745,25 @@ def _build_models_tab(tab: tk.Frame) -> None:
             messagebox.showerror("Model Settings", f"Model configuration error\n{overlap_error}\nPlease fix the intervals.")
             return
 
+        if MODEL_VOLTAGE_MAP.get(model) == v and MODEL_CRITERIA.get(model) == new_criteria:
+            messagebox.showinfo("Model Settings", "No changes to save.")
+            return
+
         MODEL_VOLTAGE_MAP[model] = v
         MODEL_CRITERIA[model] = new_criteria
+        compile_model_criteria(model)
+        is_new = add_model_to_list(model)
 
-        try:
-            save_config(MODEL_VOLTAGE_MAP, MODEL_CRITERIA, WORKERS, POWER_SUPPLIES)
-        except Exception as e:
-            messagebox.showerror("Model Settings", f"Failed to save config:\n{e}")
+        # Written now, not debounced, so "Saved successfully!" only follows a
+        # write that actually happened (any pending supply/worker edit goes too).
+        saved = save_config_now("Model Settings")
+
+        # The model is in memory either way, so the dropdown must list it.
+        if is_new:
+            model_combo["values"] = _MODELS_SORTED
+        if not saved:
             return
 
-        model_combo["values"] = sorted(MODEL_VOLTAGE_MAP.keys())
         model_var.set(model)
         refresh_models_display()
         messagebox.showinfo("Model Settings", "Saved successfully!")
@@ -1235,42 +1771,45 @@ def _build_models_tab(tab: tk.Frame) -> None:
     model_combo.bind("<<ComboboxSelected>>", load_model_settings)
 
     if MODEL_VOLTAGE_MAP:
-        first_model = sorted(MODEL_VOLTAGE_MAP.keys())[0]
+        first_model = _MODELS_SORTED[0]
         model_var.set(first_model)
         load_model_settings()
 
     refresh_models_display()
 
     # Place the Save Model button centered inside left_container (so it is visually centered with the left UI)
-    tk.Button(left_container, text="Save Model", font=("TkDefaultFont", 12), command=save_model_settings).grid(
+    tk.Button(left_container, text="Save Model", font=_ui_font(tab, 12), command=save_model_settings).grid(
         row=5, column=0, columnspan=2, pady=10
     )
 
 
 def _build_power_supplies_tab(tab: tk.Frame) -> None:
-    tk.Label(tab, text="Supplies (name = address):", font=("TkDefaultFont", 12, "bold")).pack(
+    tk.Label(tab, text="Supplies (name = address):", font=_ui_font(tab, 12, "bold")).pack(
         padx=10, pady=(10, 5), anchor="w"
     )
 
-    supply_listbox = tk.Listbox(tab, font=("TkDefaultFont", 11), height=10)
+    supply_listbox = tk.Listbox(tab, font=_ui_font(tab, 11), height=10)
     supply_listbox.pack(fill="both", expand=True, padx=10, pady=(0, 10))
 
+    def supply_row_text(ps: Dict[str, str]) -> str:
+        return f"{ps.get('name', '')} = {ps.get('address', '')}"
+
+    # Full rebuild on first build only; edits below touch just the affected row.
     def refresh_supply_listbox() -> None:
         supply_listbox.delete(0, tk.END)
-        for ps in POWER_SUPPLIES:
-            supply_listbox.insert(tk.END, f"{ps.get('name', '')} = {ps.get('address', '')}")
+        supply_listbox.insert(tk.END, *(supply_row_text(ps) for ps in POWER_SUPPLIES))
 
     refresh_supply_listbox()
 
     entries = tk.Frame(tab)
     entries.pack(fill="x", padx=10, pady=5)
 
-    tk.Label(entries, text="Name:", font=("TkDefaultFont", 11)).grid(row=0, column=0, padx=5, pady=5, sticky="e")
-    ps_name_entry = tk.Entry(entries, font=("TkDefaultFont", 11))
+    tk.Label(entries, text="Name:", font=_ui_font(tab, 11)).grid(row=0, column=0, padx=5, pady=5, sticky="e")
+    ps_name_entry = tk.Entry(entries, font=_ui_font(tab, 11))
     ps_name_entry.grid(row=0, column=1, padx=5, pady=5, sticky="we")
 
-    tk.Label(entries, text="Address:", font=("TkDefaultFont", 11)).grid(row=1, column=0, padx=5, pady=5, sticky="e")
-    ps_addr_entry = tk.Entry(entries, font=("TkDefaultFont", 11))
+    tk.Label(entries, text="Address:", font=_ui_font(tab, 11)).grid(row=1, column=0, padx=5, pady=5, sticky="e")
+    ps_addr_entry = tk.Entry(entries, font=_ui_font(tab, 11))
     ps_addr_entry.grid(row=1, column=1, padx=5, pady=5, sticky="we")
 
     entries.grid_columnconfigure(1, weight=1)
@@ -1285,8 +1824,8 @@ def _build_power_supplies_tab(tab: tk.Frame) -> None:
 
         idx = sel[0]
         text = supply_listbox.get(idx)
-        if " = " in text:
-            nm, ad = text.split(" = ", 1)
+        nm, sep, ad = text.partition(" = ")
+        if sep:
             ps_name_entry.delete(0, tk.END)
             ps_name_entry.insert(0, nm)
             ps_addr_entry.delete(0, tk.END)
@@ -1301,22 +1840,23 @@ def _build_power_supplies_tab(tab: tk.Frame) -> None:
             messagebox.showwarning("Power Supply Settings", "Name and Address cannot be empty.")
             return
 
-        existing = next((ps for ps in POWER_SUPPLIES if ps.get("name") == nm), None)
-        if existing:
-            existing["address"] = ad
+        idx = _SUPPLY_NAME_TO_IDX.get(nm)
+        is_new = idx is None
+        if not is_new:
+            POWER_SUPPLIES[idx]["address"] = ad
         else:
             if len(POWER_SUPPLIES) >= 4:
                 messagebox.showwarning("Power Supply Settings", "Maximum 4 supplies allowed.")
                 return
             POWER_SUPPLIES.append({"name": nm, "address": ad})
+            rebuild_supply_index()
+            idx = len(POWER_SUPPLIES) - 1
 
-        try:
-            save_config(MODEL_VOLTAGE_MAP, MODEL_CRITERIA, WORKERS, POWER_SUPPLIES)
-        except Exception as e:
-            messagebox.showerror("Power Supply Settings", f"Failed to save config:\n{e}")
-            return
+        schedule_config_save(tab)
 
-        refresh_supply_listbox()
+        if not is_new:
+            supply_listbox.delete(idx)
+        supply_listbox.insert(idx, supply_row_text(POWER_SUPPLIES[idx]))
 
     def delete_supply() -> None:
         sel = supply_listbox.curselection()
@@ -1324,53 +1864,49 @@ def _build_power_supplies_tab(tab: tk.Frame) -> None:
             messagebox.showwarning("Power Supply Settings", "Please select a power supply to delete.")
             return
 
+        # Listbox rows mirror POWER_SUPPLIES one-to-one, so the selection is the list index.
         idx = sel[0]
-        text = supply_listbox.get(idx)
-        nm = text.split(" = ", 1)[0] if " = " in text else text
-
-        POWER_SUPPLIES[:] = [ps for ps in POWER_SUPPLIES if ps.get("name") != nm]
-
-        try:
-            save_config(MODEL_VOLTAGE_MAP, MODEL_CRITERIA, WORKERS, POWER_SUPPLIES)
-        except Exception as e:
-            messagebox.showerror("Power Supply Settings", f"Failed to save config:\n{e}")
+        if idx >= len(POWER_SUPPLIES):
             return
+        del POWER_SUPPLIES[idx]
+        rebuild_supply_index()
+
+        schedule_config_save(tab)
 
-        refresh_supply_listbox()
+        supply_listbox.delete(idx)
         ps_name_entry.delete(0, tk.END)
         ps_addr_entry.delete(0, tk.END)
 
     btns = tk.Frame(tab)
     btns.pack(fill="x", padx=10, pady=10)
 
-    tk.Button(btns, text="Add / Update", font=("TkDefaultFont", 11), command=add_or_update_supply).pack(side="left", padx=5)
-    tk.Button(btns, text="Delete", font=("TkDefaultFont", 11), command=delete_supply).pack(side="left", padx=5)
+    tk.Button(btns, text="Add / Update", font=_ui_font(tab, 11), command=add_or_update_supply).pack(side="left", padx=5)
+    tk.Button(btns, text="Delete", font=_ui_font(tab, 11), command=delete_supply).pack(side="left", padx=5)
 
 
 def _build_workers_tab(tab: tk.Frame) -> None:
-    tk.Label(tab, text="Workers (ID = password):", font=("TkDefaultFont", 12, "bold")).pack(
+    tk.Label(tab, text="Workers (ID = password):", font=_ui_font(tab, 12, "bold")).pack(
         padx=10, pady=(10, 5), anchor="w"
     )
 
-    worker_listbox = tk.Listbox(tab, font=("TkDefaultFont", 11), height=10)
+    worker_listbox = tk.Listbox(tab, font=_ui_font(tab, 11), height=10)
     worker_listbox.pack(fill="both", expand=True, padx=10, pady=(0, 10))
 
     def refresh_worker_listbox() -> None:
         worker_listbox.delete(0, tk.END)
-        for wid in sorted(WORKERS.keys()):
-            worker_listbox.insert(tk.END, f"{wid} = {WORKERS[wid]}")
+        worker_listbox.insert(tk.END, *(f"{wid} = {WORKERS[wid]}" for wid in sorted(WORKERS)))
 
     refresh_worker_listbox()
 
     wf = tk.Frame(tab)
     wf.pack(fill="x", padx=10, pady=5)
 
-    tk.Label(wf, text="Worker ID:", font=("TkDefaultFont", 11)).grid(row=0, column=0, padx=5, pady=5, sticky="e")
-    worker_id_entry = tk.Entry(wf, font=("TkDefaultFont", 11))
+    tk.Label(wf, text="Worker ID:", font=_ui_font(tab, 11)).grid(row=0, column=0, padx=5, pady=5, sticky="e")
+    worker_id_entry = tk.Entry(wf, font=_ui_font(tab, 11))
     worker_id_entry.grid(row=0, column=1, padx=5, pady=5, sticky="we")
 
-    tk.Label(wf, text="Password:", font=("TkDefaultFont", 11)).grid(row=1, column=0, padx=5, pady=5, sticky="e")
-    worker_pw_entry = tk.Entry(wf, font=("TkDefaultFont", 11), show="*")
+    tk.Label(wf, text="Password:", font=_ui_font(tab, 11)).grid(row=1, column=0, padx=5, pady=5, sticky="e")
+    worker_pw_entry = tk.Entry(wf, font=_ui_font(tab, 11), show="*")
     worker_pw_entry.grid(row=1, column=1, padx=5, pady=5, sticky="we")
 
     wf.grid_columnconfigure(1, weight=1)
@@ -1385,8 +1921,8 @@ def _build_workers_tab(tab: tk.Frame) -> None:
 
         idx = sel[0]
         text = worker_listbox.get(idx)
-        if " = " in text:
-            wid, pw = text.split(" = ", 1)
+        wid, sep, pw = text.partition(" = ")
+        if sep:
             worker_id_entry.delete(0, tk.END)
             worker_id_entry.insert(0, wid)
             worker_pw_entry.delete(0, tk.END)
@@ -1406,14 +1942,15 @@ def _build_workers_tab(tab: tk.Frame) -> None:
             messagebox.showwarning("Worker Settings", "Cannot use reserved username as a worker ID.")
             return
 
+        is_new = wid not in WORKERS
         WORKERS[wid] = pw
-        try:
-            save_config(MODEL_VOLTAGE_MAP, MODEL_CRITERIA, WORKERS, POWER_SUPPLIES)
-        except Exception as e:
-            messagebox.showerror("Worker Settings", f"Failed to save config:\n{e}")
-            return
+        schedule_config_save(tab)
 
-        refresh_worker_listbox()
+        # The listbox mirrors sorted(WORKERS); replace or insert just this row.
+        idx = sorted(WORKERS).index(wid)
+        if not is_new:
+            worker_listbox.delete(idx)
+        worker_listbox.insert(idx, f"{wid} = {pw}")
 
     def delete_worker() -> None:
         sel = worker_listbox.curselection()
@@ -1423,28 +1960,23 @@ def _build_workers_tab(tab: tk.Frame) -> None:
 
         idx = sel[0]
         text = worker_listbox.get(idx)
-        if " = " not in text:
+        wid, sep, _ = text.partition(" = ")
+        if not sep:
             return
 
-        wid = text.split(" = ", 1)[0]
-
         if wid in WORKERS and messagebox.askyesno("Worker Settings", f"Delete worker '{wid}'?"):
             del WORKERS[wid]
-            try:
-                save_config(MODEL_VOLTAGE_MAP, MODEL_CRITERIA, WORKERS, POWER_SUPPLIES)
-            except Exception as e:
-                messagebox.showerror("Worker Settings", f"Failed to save config:\n{e}")
-                return
+            schedule_config_save(tab)
 
-            refresh_worker_listbox()
+            worker_listbox.delete(idx)
             worker_id_entry.delete(0, tk.END)
             worker_pw_entry.delete(0, tk.END)
 
     wb_frame = tk.Frame(tab)
     wb_frame.pack(fill="x", padx=10, pady=10)
 
-    tk.Button(wb_frame, text="Add / Update", font=("TkDefaultFont", 11), command=add_or_update_worker).pack(side="left", padx=5)
-    tk.Button(wb_frame, text="Delete", font=("TkDefaultFont", 11), command=delete_worker).pack(side="left", padx=5)
+    tk.Button(wb_frame, text="Add / Update", font=_ui_font(tab, 11), command=add_or_update_worker).pack(side="left", padx=5)
+    tk.Button(wb_frame, text="Delete", font=_ui_font(tab, 11), command=delete_worker).pack(side="left", padx=5)
 
 
 # ============================================================
@@ -1481,23 +2013,23 @@ def _build_pseudo_mode_tab(tab: tk.Frame) -> None:
     center_frame.grid_columnconfigure(3, weight=0)
 
     # Sub PBA fail probability
-    tk.Label(center_frame, text="Sub PBA Fail Probability (0.0 - 1.0):", font=("TkDefaultFont", 12)).grid(
+    tk.Label(center_frame, text="Sub PBA Fail Probability (0.0 - 1.0):", font=_ui_font(tab, 12)).grid(
         row=0, column=0, columnspan=1, sticky="e", padx=(6, 6), pady=(6, 6)
     )
     prob_var = tk.StringVar(value=str(PSEUDO_SUB_PBA_FAIL_PROB))
-    prob_entry = tk.Entry(center_frame, textvariable=prob_var, font=("TkDefaultFont", 12), width=12)
+    prob_entry = tk.Entry(center_frame, textvariable=prob_var, font=_ui_font(tab, 12), width=12)
     prob_entry.grid(row=0, column=1, sticky="w", padx=(6, 6), pady=(6, 6))
 
     # Random range (min ~ max)
-    tk.Label(center_frame, text="Pseudo random range (min ~ max) [A]:", font=("TkDefaultFont", 12)).grid(
+    tk.Label(center_frame, text="Pseudo random range (min ~ max) [A]:", font=_ui_font(tab, 12)).grid(
         row=1, column=0, sticky="e", padx=(6, 6), pady=(6, 6)
     )
     range_min_var = tk.StringVar(value=str(PSEUDO_RANDOM_MIN))
     range_max_var = tk.StringVar(value=str(PSEUDO_RANDOM_MAX))
-    range_min_entry = tk.Entry(center_frame, textvariable=range_min_var, font=("TkDefaultFont", 12), width=8)
-    range_max_entry = tk.Entry(center_frame, textvariable=range_max_var, font=("TkDefaultFont", 12), width=8)
+    range_min_entry = tk.Entry(center_frame, textvariable=range_min_var, font=_ui_font(tab, 12), width=8)
+    range_max_entry = tk.Entry(center_frame, textvariable=range_max_var, font=_ui_font(tab, 12), width=8)
     range_min_entry.grid(row=1, column=1, sticky="w", padx=(6, 2), pady=(6, 6))
-    tk.Label(center_frame, text=" to ", font=("TkDefaultFont", 12)).grid(row=1, column=2, sticky="w", padx=(0, 0), pady=(6, 6))
+    tk.Label(center_frame, text=" to ", font=_ui_font(tab, 12)).grid(row=1, column=2, sticky="w", padx=(0, 0), pady=(6, 6))
     range_max_entry.grid(row=1, column=3, sticky="w", padx=(2, 6), pady=(6, 6))
 
     # Fixed output mode checkbox (placed in its own row, centered)
@@ -1505,11 +2037,11 @@ def _build_pseudo_mode_tab(tab: tk.Frame) -> None:
 
     # Pre-create the fixed value entry but do not grid it yet; parent is center_frame
     fixed_value_var = tk.StringVar(value=str(PSEUDO_FIXED_OUTPUT_VALUE))
-    fixed_value_entry = tk.Entry(center_frame, textvariable=fixed_value_var, font=("TkDefaultFont", 12), width=12)
-    fixed_value_label = tk.Label(center_frame, text="Fixed Avg Current [A]:", font=("TkDefaultFont", 12))
+    fixed_value_entry = tk.Entry(center_frame, textvariable=fixed_value_var, font=_ui_font(tab, 12), width=12)
+    fixed_value_label = tk.Label(center_frame, text="Fixed Avg Current [A]:", font=_ui_font(tab, 12))
 
     # Place checkbox in its own row; centered by spanning multiple columns
-    fixed_check = tk.Checkbutton(center_frame, text="Fixed output (avg current) mode", variable=fixed_var, font=("TkDefaultFont", 12))
+    fixed_check = tk.Checkbutton(center_frame, text="Fixed output (avg current) mode", variable=fixed_var, font=_ui_font(tab, 12))
     fixed_check.grid(row=2, column=0, columnspan=4, pady=(10, 6))
 
     # Function to show/hide the fixed_value entry BELOW the checkbox
@@ -1591,8 +2123,8 @@ def _build_pseudo_mode_tab(tab: tk.Frame) -> None:
             fixed_value_label.grid_forget()
             fixed_value_entry.grid_forget()
 
-    tk.Button(btns_frame, text="Apply", font=("TkDefaultFont", 12), command=apply_pseudo_settings).pack(side="left", padx=8)
-    tk.Button(btns_frame, text="Reset", font=("TkDefaultFont", 12), command=reset_pseudo_settings).pack(side="left", padx=8)
+    tk.Button(btns_frame, text="Apply", font=_ui_font(tab, 12), command=apply_pseudo_settings).pack(side="left", padx=8)
+    tk.Button(btns_frame, text="Reset", font=_ui_font(tab, 12), command=reset_pseudo_settings).pack(side="left", padx=8)
 
     # ensure initial state matches globals
     reset_pseudo_settings()
@@ -1628,6 +2160,35 @@ def center_window(win, width=None, height=None) -> None:
         pass
 
 
+# Fonts behind the Results.Treeview style. Holding them here keeps Tk from
+# deleting them and lets later main windows skip the setup.
+_RESULTS_FONTS: Dict[str, tkfont.Font] = {}
+
+
+def _init_results_styles(master: tk.Misc) -> None:
+    """Configure the results table style and fonts once per process."""
+
+    if _RESULTS_FONTS:
+        return
+
+    style = ttk.Style(master)
+    try:
+        heading_font = tkfont.Font(name='ResultsHeadingFont', exists=False, font='TkHeadingFont')
+    except Exception:
+        heading_font = tkfont.Font(font='TkHeadingFont')
+    heading_font.configure(size=int(RESULTS_HEADER_FONT_SIZE), weight='bold')
+    style.configure('Results.Treeview.Heading', font=heading_font)
+
+    try:
+        body_font = tkfont.Font(name='ResultsBodyFont', exists=False, font='TkDefaultFont')
+    except Exception:
+        body_font = tkfont.Font(font='TkDefaultFont')
+    body_font.configure(size=int(RESULTS_BODY_FONT_SIZE), weight='normal')
+    style.configure('Results.Treeview', font=body_font)
+
+    _RESULTS_FONTS.update(heading=heading_font, body=body_font)
+
+
 def open_main_window(root: tk.Tk) -> None:
     main_window = tk.Toplevel(root)
     main_window.title(APP_TITLE_RESULTS)
@@ -1644,22 +2205,15 @@ def open_main_window(root: tk.Tk) -> None:
 
     columns = tuple(SUMMARY_HEADERS)
 
-    style = ttk.Style(main_window)
-    try:
-        heading_font = tkfont.Font(name='ResultsHeadingFont', exists=False, font='TkHeadingFont')
-    except Exception:
-        heading_font = tkfont.Font(font='TkHeadingFont')
-    heading_font.configure(size=int(RESULTS_HEADER_FONT_SIZE), weight='bold')
-    style.configure('Results.Treeview.Heading', font=heading_font)
+    _init_results_styles(main_window)
 
-    try:
-        body_font = tkfont.Font(name='ResultsBodyFont', exists=False, font='TkDefaultFont')
-    except Exception:
-        body_font = tkfont.Font(font='TkDefaultFont')
-    body_font.configure(size=int(RESULTS_BODY_FONT_SIZE), weight='normal')
-    style.configure('Results.Treeview', font=body_font)
+    # Table and its scrollbar share a subframe so they sit in separate columns.
+    table_frame = tk.Frame(main_window)
+    table_frame.grid(row=0, column=0, sticky="nsew")
+    table_frame.grid_rowconfigure(0, weight=1)
+    table_frame.grid_columnconfigure(0, weight=1)
 
-    tree = ttk.Treeview(main_window, columns=columns, show="headings", selectmode="extended", style='Results.Treeview')
+    tree = ttk.Treeview(table_frame, columns=columns, show="headings", selectmode="extended", style='Results.Treeview')
     for col in columns:
         tree.heading(col, text=col)
         tree.column(col, width=85, anchor="center")
@@ -1668,32 +2222,94 @@ def open_main_window(root: tk.Tk) -> None:
     tree.tag_configure("green_row", background="#b6fcd5")
     tree.tag_configure("red_row", background="#ffb6b6")
 
-    scrollbar = ttk.Scrollbar(main_window, orient="vertical", command=tree.yview)
+    scrollbar = ttk.Scrollbar(table_frame, orient="vertical", command=tree.yview)
     tree.configure(yscrollcommand=scrollbar.set)
 
     tree.grid(row=0, column=0, sticky="nsew")
-    scrollbar.grid(row=0, column=0, sticky="nse")
+    scrollbar.grid(row=0, column=1, sticky="ns")
+
+    # Result rows from all panels are inserted together on the next idle pass,
+    # so panels that finish in the same moment cost one tree redraw.
+    pending_rows: List[Tuple[Tuple[Any, ...], Tuple[str, ...], RunSeries, Optional[str]]] = []
+
+    # item id -> row values, in tree order (rows are only appended or deleted),
+    # so reading rows back never goes through Tk.
+    row_values: Dict[str, Tuple[Any, ...]] = {}
+
+    def flush_pending_rows() -> None:
+        rows = pending_rows[:]
+        pending_rows.clear()
+        for values, tags, series, iid in rows:
+            # The run's series token doubles as the item id; Tk picks one otherwise.
+            if iid in row_values:
+                iid = None
+            item_id = tree.insert("", tk.END, iid=iid, values=values, tags=tags)
+            row_values[item_id] = values
+            RUN_SERIES_BY_ROW[item_id] = series
+
+    def add_result_row(
+        values: Tuple[Any, ...], tags: Tuple[str, ...], series: RunSeries, iid: Optional[str] = None
+    ) -> None:
+        if not pending_rows:
+            main_window.after_idle(flush_pending_rows)
+        pending_rows.append((values, tags, series, iid))
 
     if not current_user.get("is_dev"):
         global USE_PSEUDO_CURRENT
         USE_PSEUDO_CURRENT = False
 
     def export_to_excel() -> None:
-        rows = [tree.item(item)["values"] for item in tree.get_children()]
+        rows = list(row_values.values())
         if not rows:
             messagebox.showwarning("Export Data", "No data to export.")
             return
 
-        df = pd.DataFrame(rows, columns=columns)
         file_path = filedialog.asksaveasfilename(defaultextension=".xlsx", filetypes=[("Excel files", "*.xlsx")])
         if not file_path:
             return
 
-        try:
-            df.to_excel(file_path, index=False)
-            messagebox.showinfo("Export Data", f"Data exported successfully to {file_path}")
-        except Exception as e:
-            messagebox.showerror("Export Error", f"Failed to export data.\n{e}")
+        # The rows were snapshotted above, so the workbook is built
+        # and saved on a worker and only the outcome comes back to Tk.
+        result: queue.Queue = queue.Queue(maxsize=1)
+
+        def write_workbook() -> None:
+            try:
+                from openpyxl import Workbook
+                from openpyxl.cell import WriteOnlyCell
+                from openpyxl.styles import Font
+
+                # Stream rows straight into a write-only sheet; no DataFrame copy.
+                wb = Workbook(write_only=True)
+                ws = wb.create_sheet("Sheet1")
+                bold = Font(bold=True)
+                header = []
+                for name in columns:
+                    cell = WriteOnlyCell(ws, value=name)
+                    cell.font = bold
+                    header.append(cell)
+                ws.append(header)
+                for values in rows:
+                    ws.append(values)
+                wb.save(file_path)
+            except Exception as e:
+                result.put(e)
+            else:
+                result.put(None)
+
+        def poll_export() -> None:
+            try:
+                err = result.get_nowait()
+            except queue.Empty:
+                main_window.after(50, poll_export)
+                return
+            if err is None:
+                messagebox.showinfo("Export Data", f"Data exported successfully to {file_path}")
+            else:
+                messagebox.showerror("Export Error", f"Failed to export data.\n{err}")
+
+        # Not a daemon: closing the window mid-export still finishes the file.
+        threading.Thread(target=write_workbook, name="excel-export").start()
+        main_window.after(50, poll_export)
 
     def delete_selected_rows() -> None:
         selected = tree.selection()
@@ -1704,6 +2320,7 @@ def open_main_window(root: tk.Tk) -> None:
         for item in selected:
             if item in RUN_SERIES_BY_ROW:
                 del RUN_SERIES_BY_ROW[item]
+            row_values.pop(item, None)
             tree.delete(item)
 
     right = tk.Frame(main_window)
@@ -1711,7 +2328,7 @@ def open_main_window(root: tk.Tk) -> None:
     right.grid_columnconfigure(0, weight=1)
     right.grid_rowconfigure(2, weight=1)
 
-    tk.Label(right, text="Run Panels (PSU1 - PSU4)", font=("TkDefaultFont", 14, "bold")).grid(
+    tk.Label(right, text="Run Panels (PSU1 - PSU4)", font=_ui_font(main_window, 14, "bold")).grid(
         row=0, column=0, sticky="w", pady=(0, 8)
     )
 
@@ -1731,21 +2348,21 @@ def open_main_window(root: tk.Tk) -> None:
     center_bar.grid(row=1, column=0)
     center_bar.grid_columnconfigure(0, weight=1)
 
-    export_btn = tk.Button(center_bar, text="Export to Excel", font=("TkDefaultFont", 12), command=export_to_excel)
+    export_btn = tk.Button(center_bar, text="Export to Excel", font=_ui_font(main_window, 12), command=export_to_excel)
 
     if current_user["is_admin"]:
         export_btn.grid(row=0, column=0, sticky="ew", pady=(0, 8))
         tk.Button(
             center_bar,
             text="Delete Selected Row(s)",
-            font=("TkDefaultFont", 12),
+            font=_ui_font(main_window, 12),
             command=delete_selected_rows,
         ).grid(row=1, column=0, sticky="ew", pady=(0, 8))
 
         tk.Button(
             center_bar,
             text="Configuration",
-            font=("TkDefaultFont", 12),
+            font=_ui_font(main_window, 12),
             command=lambda: open_configuration_dialog(main_window),
         ).grid(row=2, column=0, sticky="ew")
     else:
@@ -1761,27 +2378,36 @@ def open_main_window(root: tk.Tk) -> None:
         tk.Checkbutton(
             center_bar,
             text="Use pseudo current (no power supply)",
-            font=("TkDefaultFont", 12),
+            font=_ui_font(main_window, 12),
             variable=pseudo_mode_var,
             command=on_toggle_pseudo_mode,
         ).grid(row=3, column=0, sticky="w", pady=(12, 0))
 
     panel_frames: List[Optional[ttk.LabelFrame]] = [None, None, None, None]
 
+    # Open graph windows by row; a repeat double-click raises the existing one.
+    plot_windows: Dict[str, tk.Toplevel] = {}
+
     def show_run_graph(item_id: str) -> None:
+        existing = plot_windows.get(item_id)
+        if existing is not None and existing.winfo_exists():
+            existing.deiconify()
+            existing.lift()
+            existing.focus_set()
+            return
+
         data = RUN_SERIES_BY_ROW.get(item_id)
         if not data:
             messagebox.showwarning("Plot Current", "No measurement data stored for this run.")
             return
 
-        samples = data.get("samples", [])
-        currents = data.get("currents", [])
+        samples = data.samples
+        currents = data.currents
         if not samples or not currents:
             messagebox.showwarning("Plot Current", "Measurement data for this run is empty.")
             return
 
-        currents_mA = [c * 1000.0 for c in currents]
-        values = tree.item(item_id, "values") or ["", "", "", "", "", "", ""]
+        values = row_values.get(item_id) or ("",) * len(columns)
 
         imei = values[0]
         model = values[1]
@@ -1791,6 +2417,15 @@ def open_main_window(root: tk.Tk) -> None:
         plot_win = tk.Toplevel(main_window)
         plot_win.title(f"Current vs Sample - IMEI {imei}")
         plot_win.geometry(PLOT_WINDOW_GEOMETRY)
+        plot_windows[item_id] = plot_win
+        plot_win.bind("<Destroy>", lambda e: plot_windows.pop(item_id, None) if e.widget is plot_win else None)
+
+        import numpy as np
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from matplotlib.figure import Figure
+
+        # One vectorised A -> mA scale; matplotlib would convert a list to an array anyway.
+        currents_mA = np.multiply(currents, 1000.0)
 
         fig = Figure(figsize=(6, 4), dpi=100)
         ax = fig.add_subplot(111)
@@ -1801,10 +2436,55 @@ def open_main_window(root: tk.Tk) -> None:
         ax.grid(True)
 
         canvas = FigureCanvasTkAgg(fig, master=plot_win)
-        canvas.draw()
+        canvas.draw_idle()
         canvas.get_tk_widget().pack(fill="both", expand=True)
 
-    tree.bind("<Double-1>", lambda e: (lambda rid: show_run_graph(rid) if rid else None)(tree.identify_row(e.y)))
+    def on_tree_double_click(event) -> None:
+        item_id = tree.identify_row(event.y)
+        if item_id:
+            show_run_graph(item_id)
+
+    tree.bind("<Double-1>", on_tree_double_click)
+
+    # One 100 ms timer drains the queues of all running panels, and only
+    # while at least one panel is running.
+    panel_pollers: Dict[int, Callable[[], bool]] = {}
+    poller_scheduled = False
+    # Panels whose drain has not returned yet (it is waiting in a modal
+    # dialog's nested event loop); later passes skip them instead of re-entering.
+    draining_panels: Set[int] = set()
+
+    def poll_panels() -> None:
+        nonlocal poller_scheduled
+        if not panel_pollers:
+            poller_scheduled = False
+            return
+
+        # Queue the next pass before draining: while one panel's dialog is open,
+        # its nested event loop keeps running this timer for the other panels.
+        main_window.after(100, poll_panels)
+
+        for idx, drain in list(panel_pollers.items()):
+            if idx in draining_panels:
+                continue
+            draining_panels.add(idx)
+            try:
+                keep = drain()
+            except Exception:
+                root.report_callback_exception(*sys.exc_info())
+                keep = False
+            finally:
+                draining_panels.discard(idx)
+            # A finished run may already have been replaced by a new one on this panel.
+            if not keep and panel_pollers.get(idx) is drain:
+                del panel_pollers[idx]
+
+    def register_panel_poller(panel_index: int, drain: Callable[[], bool]) -> None:
+        nonlocal poller_scheduled
+        panel_pollers[panel_index] = drain
+        if not poller_scheduled:
+            poller_scheduled = True
+            main_window.after(100, poll_panels)
 
     def run_from_panel(
         panel_index: int,
@@ -1842,8 +2522,18 @@ def open_main_window(root: tk.Tk) -> None:
         cancel_btn.config(state="normal")
         progress_bar.config(mode="indeterminate", maximum=100, value=0)
         progress_bar.start(10)
-        progress_var.set("Initializing...")
+        shown_progress = progress_var.get()
 
+        def set_progress(text: str) -> None:
+            # Ticks often render the same text again; skip the Tcl variable write then.
+            nonlocal shown_progress
+            if text != shown_progress:
+                shown_progress = text
+                progress_var.set(text)
+
+        set_progress("Initializing...")
+
+        id_val = current_user["username"]  # the worker who started this run
         q: queue.Queue = queue.Queue()
         prompt_response_queue: queue.Queue = queue.Queue()
         stop_event = threading.Event()
@@ -1852,7 +2542,8 @@ def open_main_window(root: tk.Tk) -> None:
         def on_cancel_inline() -> None:
             cancel_btn.config(state="disabled")
             stop_event.set()
-            progress_var.set("Cancelling...")
+            prompt_response_queue.put(None)
+            set_progress("Cancelling...")
 
         cancel_btn.config(command=on_cancel_inline)
 
@@ -1874,10 +2565,19 @@ def open_main_window(root: tk.Tk) -> None:
         )
         worker.start()
 
-        ACTIVE_JOBS[panel_index] = PanelJob(panel_index=panel_index, thread=worker, stop_event=stop_event, series_token=series_token)
+        ACTIVE_JOBS[panel_index] = PanelJob(
+            panel_index=panel_index,
+            thread=worker,
+            stop_event=stop_event,
+            series_token=series_token,
+            prompt_response_queue=prompt_response_queue,
+        )
 
         def finish_job_ui() -> None:
             ACTIVE_JOBS[panel_index] = None
+            # Runs that end without "done"/"sub_pba_fail" still release their series.
+            with SERIES_LOCK:
+                SERIES_BY_TOKEN.pop(series_token, None)
             try:
                 progress_bar.stop()
             except Exception:
@@ -1889,21 +2589,25 @@ def open_main_window(root: tk.Tk) -> None:
             imei_entry.config(state="normal")
             model_entry.config(state="normal")
 
-        def poll_queue_inline() -> None:
+        def poll_queue_inline() -> bool:
+            """Drain this panel's queue; False once the run is over."""
+
+            pending = None
             try:
                 while True:
-                    msg = q.get_nowait()
+                    msg = pending if pending is not None else q.get_nowait()
+                    pending = None
                     kind = msg[0]
 
                     if kind == "status":
-                        progress_var.set(msg[1])
+                        set_progress(msg[1])
 
                     elif kind == "phase":
                         phase = msg[1]
                         if phase == "waiting":
                             progress_bar.config(mode="indeterminate", maximum=100, value=0)
                             progress_bar.start(10)
-                            progress_var.set("Waiting for device current...")
+                            set_progress("Waiting for device current...")
                         elif phase == "measuring":
                             try:
                                 progress_bar.stop()
@@ -1911,19 +2615,31 @@ def open_main_window(root: tk.Tk) -> None:
                                 pass
                             progress_bar.config(mode="determinate", maximum=SAMPLE_COUNT, value=0)
                             if USE_PSEUDO_CURRENT:
-                                progress_var.set(f"Remaining: {PSEUDO_SAMPLING_SECONDS:.1f}s")
+                                set_progress(f"Remaining: {PSEUDO_SAMPLING_SECONDS:.1f}s")
                             else:
-                                progress_var.set(f"Remaining: {SAMPLE_COUNT}s")
+                                set_progress(f"Remaining: {SAMPLE_COUNT}s")
 
                     elif kind == "tick":
+                        # Only the newest of back-to-back ticks would be visible; skip to it
+                        # and hold the first non-tick message for the next iteration.
+                        try:
+                            while True:
+                                nxt = q.get_nowait()
+                                if nxt[0] != "tick":
+                                    pending = nxt
+                                    break
+                                msg = nxt
+                        except queue.Empty:
+                            pass
+
                         i, total, current_val = msg[1], msg[2], msg[3]
                         progress_bar["value"] = i
                         remaining = max(total - i, 0)
                         if USE_PSEUDO_CURRENT:
                             remaining_s = (float(PSEUDO_SAMPLING_SECONDS) * float(remaining)) / float(max(total, 1))
-                            progress_var.set(f"Remaining: {remaining_s:.1f}s  |  I={current_val:.3f}A")
+                            set_progress(f"Remaining: {remaining_s:.1f}s  |  I={current_val:.3f}A")
                         else:
-                            progress_var.set(f"Remaining: {remaining}s  |  I={current_val:.3f}A")
+                            set_progress(f"Remaining: {remaining}s  |  I={current_val:.3f}A")
 
                     elif kind == "prompt_device_check":
                         supply_for_prompt = msg[1] if len(msg) >= 3 else "PSU"
@@ -1938,110 +2654,106 @@ def open_main_window(root: tk.Tk) -> None:
                     elif kind == "config_error":
                         error_msg = msg[1]
                         messagebox.showerror("Model configuration error", error_msg)
-                        progress_var.set("Config Error")
+                        set_progress("Config Error")
                         status_label.config(text="CONFIG ERROR", fg="red")
                         finish_job_ui()
-                        return
+                        return False
 
                     elif kind == "done":
                         avg_last5 = msg[1]
                         supply_used = msg[3]
                         token = msg[4]
 
+                        # The worker has stopped appending once it posts "done", so
+                        # the series is taken out of the store and used without copying.
                         with SERIES_LOCK:
-                            series = SERIES_BY_TOKEN.get(token, {"times": [], "currents": []})
-                            samples = list(series.get("times", []))
-                            currents = list(series.get("currents", []))
+                            series = SERIES_BY_TOKEN.pop(token, {"times": [], "currents": []})
+                        samples = series.get("times", [])
+                        currents = series.get("currents", [])
 
                         try:
                             avg_current = float(avg_last5)
                             pf_status = get_pf_status(model, avg_current, samples=currents)
-                            id_val = current_user["username"]
-                            date_val = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                            date_val = datetime.now().isoformat(sep=" ", timespec="seconds")
                             avg_current_str = f"{avg_current:.3f}A"
 
                             row = (imei, model, avg_current_str, pf_status, id_val, supply_used, date_val)
                             tag = "green_row" if pf_status == "PASS" else "red_row"
-                            item_id = tree.insert("", tk.END, values=row, tags=(tag,))
-                            RUN_SERIES_BY_ROW[item_id] = {"samples": samples, "currents": currents, "supply": supply_used}
-
-                            with LOG_WRITE_LOCK:
-                                try:
-                                    detail_rows = [(imei, model, id_val, supply_used, date_val, s, c) for s, c in zip(samples, currents)]
-                                    append_run_to_daily_log(summary_row=row, detail_rows=detail_rows)
-                                except PermissionError:
-                                    show_log_file_open_error(main_window, get_daily_log_saved_path())
-                                except Exception as log_e:
-                                    messagebox.showerror("Log Error", f"Failed to save log: {log_e}")
-
-                            progress_var.set(f"Done: {pf_status} ({avg_current:.3f}A)")
+                            add_result_row(row, (tag,), RunSeries(array("i", samples), array("d", currents), supply_used), token)
+
+                            prefix = (imei, model, id_val, supply_used, date_val)
+                            detail_rows = (prefix + (s, c) for s, c in zip(samples, currents))
+                            enqueue_daily_log(row, detail_rows, q)
+                            cancel_btn.config(state="disabled")
+
+                            set_progress(f"Done: {pf_status} ({avg_current:.3f}A)")
                             status_label.config(text=pf_status, fg=("green" if pf_status == "PASS" else "red"))
 
                         except Exception as e:
                             messagebox.showerror("Measurement Error", f"Failed to process result: {e}")
-                            progress_var.set("Error")
-                        finally:
+                            set_progress("Error")
                             finish_job_ui()
-                        return
+                            return False
 
                     elif kind == "sub_pba_fail":
                         supply_used = msg[1]
                         token = msg[2] if len(msg) > 2 else None
 
                         with SERIES_LOCK:
-                            series = SERIES_BY_TOKEN.get(token, {"times": [], "currents": []}) if token else {"times": [], "currents": []}
-                            samples = list(series.get("times", []))
-                            currents = list(series.get("currents", []))
+                            series = SERIES_BY_TOKEN.pop(token, {"times": [], "currents": []}) if token else {"times": [], "currents": []}
+                        samples = series.get("times", [])
+                        currents = series.get("currents", [])
 
                         try:
                             pf_status = "PASS(Sub PBA issue)"
                             avg_current_str = "0.000A"
-                            id_val = current_user["username"]
-                            date_val = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                            date_val = datetime.now().isoformat(sep=" ", timespec="seconds")
 
                             row = (imei, model, avg_current_str, pf_status, id_val, supply_used, date_val)
-                            item_id = tree.insert("", tk.END, values=row, tags=("green_row",))
-                            RUN_SERIES_BY_ROW[item_id] = {
-                                "samples": samples or [0],
-                                "currents": currents or [0.0],
-                                "supply": supply_used,
-                            }
-
-                            with LOG_WRITE_LOCK:
-                                try:
-                                    append_run_to_daily_log(
-                                        summary_row=row,
-                                        detail_rows=[(imei, model, id_val, supply_used, date_val, 0, 0.0)],
-                                    )
-                                except PermissionError:
-                                    show_log_file_open_error(main_window, get_daily_log_saved_path())
-                                except Exception as log_e:
-                                    messagebox.showerror("Log Error", f"Failed to save log: {log_e}")
-
-                            progress_var.set("Done: PASS(Sub PBA issue)")
+                            add_result_row(
+                                row,
+                                ("green_row",),
+                                RunSeries(array("i", samples or [0]), array("d", currents or [0.0]), supply_used),
+                                token,
+                            )
+
+                            enqueue_daily_log(row, [(imei, model, id_val, supply_used, date_val, 0, 0.0)], q)
+                            cancel_btn.config(state="disabled")
+
+                            set_progress("Done: PASS(Sub PBA issue)")
                             status_label.config(text="PASS(Sub PBA issue)", fg="green")
 
                         except Exception as e:
                             messagebox.showerror("Measurement Error", f"Failed to log Sub PBA failure: {e}")
-                            progress_var.set("Error")
-                        finally:
+                            set_progress("Error")
                             finish_job_ui()
-                        return
+                            return False
+
+                    elif kind == "log_done":
+                        # The panel stays busy until its rows are on disk so an
+                        # Excel-locked log is reported before the next run.
+                        log_error, log_path = msg[1], msg[2]
+                        if isinstance(log_error, PermissionError):
+                            show_log_file_open_error(main_window, log_path)
+                        elif log_error is not None:
+                            messagebox.showerror("Log Error", f"Failed to save log: {log_error}")
+                        finish_job_ui()
+                        return False
 
                     elif kind == "error":
                         err = msg[1]
                         messagebox.showerror("Measurement Error", f"{err}")
-                        progress_var.set("Error")
+                        set_progress("Error")
                         status_label.config(text="ERROR", fg="red")
                         finish_job_ui()
-                        return
+                        return False
 
             except queue.Empty:
                 pass
 
-            main_window.after(100, poll_queue_inline)
+            return True
 
-        poll_queue_inline()
+        register_panel_poller(panel_index, poll_queue_inline)
 
     def create_panel(parent: tk.Misc, panel_index: int) -> ttk.LabelFrame:
         supply = POWER_SUPPLIES[panel_index] if panel_index < len(POWER_SUPPLIES) else {"name": f"PSU{panel_index + 1}", "address": ""}
@@ -2049,18 +2761,18 @@ def open_main_window(root: tk.Tk) -> None:
         frame = ttk.LabelFrame(parent, text=f"{supply.get('name', f'PSU{panel_index + 1}')}", padding=8)
         frame.grid_columnconfigure(1, weight=1)
 
-        tk.Label(frame, text="IMEI:", font=("TkDefaultFont", 12)).grid(row=0, column=0, sticky="e", padx=6, pady=6)
-        imei_entry = tk.Entry(frame, font=("TkDefaultFont", 12))
+        tk.Label(frame, text="IMEI:", font=_ui_font(main_window, 12)).grid(row=0, column=0, sticky="e", padx=6, pady=6)
+        imei_entry = tk.Entry(frame, font=_ui_font(main_window, 12))
         imei_entry.grid(row=0, column=1, sticky="ew", padx=6, pady=6)
 
-        tk.Label(frame, text="Model:", font=("TkDefaultFont", 12)).grid(row=1, column=0, sticky="e", padx=6, pady=6)
+        tk.Label(frame, text="Model:", font=_ui_font(main_window, 12)).grid(row=1, column=0, sticky="e", padx=6, pady=6)
         model_var = tk.StringVar()
         model_entry = ttk.Combobox(
             frame,
             textvariable=model_var,
-            values=sorted(MODEL_VOLTAGE_MAP.keys()),
+            values=_MODELS_SORTED,
             state="normal",
-            font=("TkDefaultFont", 12),
+            font=_ui_font(main_window, 12),
         )
         model_entry.grid(row=1, column=1, sticky="ew", padx=6, pady=6)
 
@@ -2069,12 +2781,12 @@ def open_main_window(root: tk.Tk) -> None:
                 pass
 
             typed = model_var.get().strip().lower()
-            all_models = sorted(MODEL_VOLTAGE_MAP.keys())
+            all_models = _MODELS_SORTED
             if not typed:
                 model_entry["values"] = all_models
                 return
 
-            filtered = [m for m in all_models if typed in m.lower()]
+            filtered = [m for m, m_lower in zip(all_models, _MODELS_SORTED_LOWER) if typed in m_lower]
             model_entry["values"] = filtered if filtered else all_models
             if filtered:
                 try:
@@ -2082,7 +2794,21 @@ def open_main_window(root: tk.Tk) -> None:
                 except Exception:
                     pass
 
-        model_entry.bind("<KeyRelease>", apply_model_filter)
+        filter_after_id: Optional[str] = None
+
+        def schedule_model_filter(_event=None) -> None:
+            # Filter once typing pauses instead of reconfiguring the dropdown per key.
+            nonlocal filter_after_id
+            if filter_after_id is not None:
+                model_entry.after_cancel(filter_after_id)
+            filter_after_id = model_entry.after(MODEL_FILTER_DEBOUNCE_MS, run_model_filter)
+
+        def run_model_filter() -> None:
+            nonlocal filter_after_id
+            filter_after_id = None
+            apply_model_filter()
+
+        model_entry.bind("<KeyRelease>", schedule_model_filter)
 
         last_model = PANEL_STATE[panel_index].get("last_model")
         if last_model:
@@ -2093,20 +2819,20 @@ def open_main_window(root: tk.Tk) -> None:
             imei_entry.insert(0, last_imei)
 
         progress_var = tk.StringVar(value="Idle")
-        tk.Label(frame, textvariable=progress_var, font=("TkDefaultFont", 10), anchor="w").grid(
+        tk.Label(frame, textvariable=progress_var, font=_ui_font(main_window, 10), anchor="w").grid(
             row=2, column=0, columnspan=2, sticky="ew", padx=6, pady=(2, 2)
         )
 
         progress_bar = ttk.Progressbar(frame, mode="determinate", maximum=SAMPLE_COUNT, value=0, length=240)
         progress_bar.grid(row=3, column=0, columnspan=2, sticky="ew", padx=6, pady=(0, 6))
 
-        status_label = tk.Label(frame, text="", font=("TkDefaultFont", 11, "bold"), anchor="w")
+        status_label = tk.Label(frame, text="", font=_ui_font(main_window, 11, "bold"), anchor="w")
         status_label.grid(row=4, column=0, columnspan=2, sticky="ew", padx=6, pady=(0, 6))
 
         btn_row = tk.Frame(frame)
         btn_row.grid(row=5, column=0, columnspan=2, pady=(4, 2))
 
-        cancel_btn = tk.Button(btn_row, text="Cancel", font=("TkDefaultFont", 11), state="disabled")
+        cancel_btn = tk.Button(btn_row, text="Cancel", font=_ui_font(main_window, 11), state="disabled")
         cancel_btn.pack(side="left", padx=4)
 
         def do_run() -> None:
@@ -2123,7 +2849,7 @@ def open_main_window(root: tk.Tk) -> None:
         run_btn = tk.Button(
             btn_row,
             text="RUN",
-            font=("TkDefaultFont", 14, "bold"),
+            font=_ui_font(main_window, 14, "bold"),
             width=10,
             command=do_run,
         )
@@ -2152,26 +2878,39 @@ def open_main_window(root: tk.Tk) -> None:
                 continue
             try:
                 job.stop_event.set()
+                if job.prompt_response_queue is not None:
+                    job.prompt_response_queue.put(None)  # wake a pending prompt wait
             except Exception:
                 pass
 
+        # Every worker was signalled above, so they wind down together; one
+        # shared 2 s budget bounds the whole shutdown, not 2 s per panel.
+        deadline = time.monotonic() + 2.0
         for job in list(ACTIVE_JOBS):
             if job is None:
                 continue
             try:
                 if job.thread.is_alive():
-                    job.thread.join(timeout=2)
+                    job.thread.join(timeout=max(0.0, deadline - time.monotonic()))
             except Exception:
                 pass
 
         for i in range(len(ACTIVE_JOBS)):
             ACTIVE_JOBS[i] = None
 
+        stop_daily_log_writer()
+        flush_config_save()
+
         main_window.destroy()
         root.destroy()
 
     main_window.protocol("WM_DELETE_WINDOW", on_close)
 
+    # Brief sign-in acknowledgement in place of a modal "Login successful" box.
+    signed_in = tk.Label(main_window, text=f"Signed in: {current_user['username']}", fg="gray")
+    signed_in.place(relx=1.0, rely=1.0, anchor="se", x=-10, y=-4)
+    main_window.after(2000, signed_in.destroy)
+
 
 # ============================================================
 # Login window / app entry point
@@ -2186,36 +2925,24 @@ def try_login(root: tk.Tk, entry_username: tk.Entry, entry_password: tk.Entry) -
 
     global USE_PSEUDO_CURRENT
 
-    if username == DEV_USERNAME and password == DEV_PASSWORD:
-        current_user["username"] = username
-        current_user["is_admin"] = True
-        current_user["is_dev"] = True
-        messagebox.showinfo("Login", "Login successful!")
-        root.withdraw()
-        open_main_window(root)
-        return
-
-    if username == ADMIN_USERNAME and password == ADMIN_PASSWORD:
-        current_user["username"] = username
-        current_user["is_admin"] = True
-        current_user["is_dev"] = False
-        USE_PSEUDO_CURRENT = False
-        messagebox.showinfo("Login", "Login successful!")
-        root.withdraw()
-        open_main_window(root)
+    # Checked in order dev, admin, workers; a worker ID may reuse a built-in name.
+    if username == DEV_USERNAME and _password_matches(password, DEV_PASSWORD):
+        is_admin, is_dev = True, True
+    elif username == ADMIN_USERNAME and _password_matches(password, ADMIN_PASSWORD):
+        is_admin, is_dev = True, False
+    elif username in WORKERS and _password_matches(password, WORKERS[username]):
+        is_admin, is_dev = False, False
+    else:
+        messagebox.showerror("Login", "Invalid credentials.")
         return
 
-    if username in WORKERS and password == WORKERS.get(username):
-        current_user["username"] = username
-        current_user["is_admin"] = False
-        current_user["is_dev"] = False
+    current_user["username"] = username
+    current_user["is_admin"] = is_admin
+    current_user["is_dev"] = is_dev
+    if not is_dev:
         USE_PSEUDO_CURRENT = False
-        messagebox.showinfo("Login", "Login successful!")
-        root.withdraw()
-        open_main_window(root)
-        return
-
-    messagebox.showerror("Login", "Invalid credentials.")
+    root.withdraw()
+    open_main_window(root)
 
 
 def main() -> None: